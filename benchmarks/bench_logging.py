@@ -0,0 +1,113 @@
+"""Benchmark of the overhead of the debug messages at the INFO and DEBUG levels.
+
+The logger is set up for each level in a temporary project. At INFO, the debug messages
+should cost next to nothing, however large the values they would show. Timed are:
+
+- one debug message with a 50-entry dict, built as an f-string, with 'debug_lazy'
+  and guarded by 'debug_enabled'
+- generating the widgets of the given number of tests and loading their state,
+  which log per test
+
+Usage::
+
+    python benchmarks/bench_logging.py --tests 5000
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytest_tui_runner.logging import debug_enabled, debug_lazy, logger, setup_logger
+from pytest_tui_runner.paths import Paths
+from pytest_tui_runner.utils.widgets.registry import WidgetRegistry
+from pytest_tui_runner.utils.widgets.state_manager import load_widget_state
+from pytest_tui_runner.utils.widgets.widget_generator import generate_widgets_from_config
+
+if TYPE_CHECKING:
+    from pytest_tui_runner.utils.types.config import Test, TestConfig
+
+LEVELS = ("INFO", "DEBUG")
+
+# Number of calls of every timed debug message
+CALLS = 5000
+
+# Value shown in the timed debug messages
+VALUE = {f"test_{i}": {"x": str(i), "action": "add"} for i in range(50)}
+
+
+def set_level(level: str) -> None:
+    """Set the logger up again, writing messages from the given level."""
+    Paths.log_config_file().write_text(f"level: {level}\n")
+    setup_logger(clear_log_file=True)
+
+
+def time_per_call(message: Callable[[], None]) -> float:
+    """Time one debug message, including writing it, in microseconds per call."""
+    start: float = time.perf_counter()
+    for _ in range(CALLS):
+        message()
+    logger.complete()
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+def guarded_message() -> None:
+    """Log the debug message only if the debug level is enabled."""
+    if debug_enabled():
+        logger.debug(f"State = {VALUE}")
+
+
+def time_per_test(count: int) -> tuple[float, float]:
+    """Time generating the widgets of the tests and loading their state, per test."""
+    tests: list[Test] = [
+        {"label": f"Test {i}", "test_name": f"test_fn_{i}"}
+        if i % 2
+        else {
+            "label": f"Test {i}",
+            "test_name": f"test_fn_{i}",
+            "arguments": [{"arg_name": "x", "arg_type": "text_input", "placeholder": "x"}],
+        }
+        for i in range(count)
+    ]
+    config: TestConfig = {
+        "categories": [{"label": "C", "subcategories": [{"label": "S", "tests": tests}]}],
+    }
+
+    start: float = time.perf_counter()
+    widgets = generate_widgets_from_config(config, None, WidgetRegistry())
+    generated: float = time.perf_counter()
+    load_widget_state(widgets, Paths.app_dir() / "missing_state.json")
+    logger.complete()
+    loaded: float = time.perf_counter()
+    return (generated - start) / count * 1e6, (loaded - generated) / count * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=5000, help="Number of tests in the config")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        Paths.set_user_root(Path(directory))
+        Paths.log_dir().mkdir(parents=True)
+        for level in LEVELS:
+            set_level(level)
+            f_string: float = time_per_call(lambda: logger.debug(f"State = {VALUE}"))
+            lazy: float = time_per_call(lambda: debug_lazy("State = {}", lambda: VALUE))
+            guarded: float = time_per_call(guarded_message)
+            generate, load_state = time_per_test(args.tests)
+            logger.remove()
+
+            print(level)
+            print(f"  f-string message:    {f_string:7.2f}us per call")
+            print(f"  debug_lazy message:  {lazy:7.2f}us per call")
+            print(f"  guarded message:     {guarded:7.2f}us per call")
+            print(f"  generating widgets:  {generate:7.2f}us per test")
+            print(f"  loading their state: {load_state:7.2f}us per test")
+
+
+if __name__ == "__main__":
+    main()
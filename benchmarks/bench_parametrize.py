@@ -0,0 +1,107 @@
+"""Benchmark of the parametrization of thousands of test functions by the plugin.
+
+A project with the given number of test functions is generated in a temporary directory,
+every function selected in the manifest with its own argument variants. The collection
+is timed with the plugin dormant and with it parametrizing every function, the difference
+is the cost of the parametrization. The lookups of the 'pytest_generate_tests' hook
+in the table built from the manifest are timed on their own.
+
+Usage::
+
+    python benchmarks/bench_parametrize.py --tests 3000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import entry_points
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest_tui_runner
+from pytest_tui_runner.utils.pytest.manifest import MANIFEST_OPTION, SelectionManifest
+from pytest_tui_runner.utils.pytest.parametrize import ParametrizeTable
+
+# Test functions per generated test module
+TESTS_PER_MODULE = 100
+
+
+def generate_project(root: Path, count: int) -> Path:
+    """Generate the test modules and the manifest selecting all their functions."""
+    tests_dir: Path = root / "tests"
+    tests_dir.mkdir()
+    manifest = SelectionManifest()
+    for module in range(0, count, TESTS_PER_MODULE):
+        functions: list[str] = []
+        for i in range(module, min(module + TESTS_PER_MODULE, count)):
+            functions.append(f"def test_fn_{i}(action, x):\n    pass\n")
+            manifest.add_test(
+                {"label": f"Test {i}", "test_name": f"test_fn_{i}"},
+                {"names": ["action", "x"], "values": [["add", str(i)], ["sub", str(i)]]},
+            )
+        (tests_dir / f"test_m{module // TESTS_PER_MODULE}.py").write_text("\n\n".join(functions))
+
+    manifest_path: Path = root / "selection.json"
+    manifest.write(manifest_path)
+    return manifest_path
+
+
+def plugin_env() -> dict[str, str]:
+    """Get the environment of pytest, loading the plugin benchmarked here."""
+    # The child imports the same package as this script, also when it is not installed
+    package_path: str = str(Path(pytest_tui_runner.__file__).parents[1])
+    env: dict[str, str] = {**os.environ, "PYTHONPATH": package_path}
+    env.pop("PYTEST_TUI_RUNNER_ROOT", None)
+    if not any(ep.value == "pytest_tui_runner" for ep in entry_points(group="pytest11")):
+        env["PYTEST_ADDOPTS"] = "-p pytest_tui_runner"
+    return env
+
+
+def time_collection(root: Path, manifest_path: Path | None) -> float:
+    """Time the collection of the tests, with the plugin active if a manifest is given."""
+    env: dict[str, str] = plugin_env()
+    args: list[str] = [sys.executable, "-m", "pytest", "--collect-only", "-qq"]
+    if manifest_path is not None:
+        env["PYTEST_TUI_RUNNER_ROOT"] = str(root)
+        args.append(f"{MANIFEST_OPTION}={manifest_path}")
+
+    start: float = time.perf_counter()
+    subprocess.run(args, cwd=root, env=env, check=True, capture_output=True)  # noqa: S603
+    return time.perf_counter() - start
+
+
+def time_lookups(manifest_path: Path) -> float:
+    """Time building the lookup table and looking up every test function in it."""
+    start: float = time.perf_counter()
+    table: ParametrizeTable = ParametrizeTable.from_manifest(SelectionManifest.read(manifest_path))
+    for test_name in table.by_test_name:
+        function = SimpleNamespace(__name__=test_name)
+        table.lookup(SimpleNamespace(function=function))  # type: ignore[arg-type]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=3000, help="Number of test functions")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        manifest_path: Path = generate_project(root, args.tests)
+        dormant: float = time_collection(root, None)
+        active: float = time_collection(root, manifest_path)
+        lookups: float = time_lookups(manifest_path)
+
+    print(f"Collecting {args.tests} test functions with 2 variants each")
+    print(f"  plugin dormant:       {dormant:6.2f}s")
+    print(f"  plugin parametrizing: {active:6.2f}s")
+    print(f"  per test function:    {(active - dormant) / args.tests * 1e6:6.1f}us")
+    print(f"  table and lookups:    {lookups / args.tests * 1e6:6.1f}us per test function")
+
+
+if __name__ == "__main__":
+    main()
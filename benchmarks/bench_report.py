@@ -0,0 +1,79 @@
+"""Benchmark of reading a synthetic report of 200k tests.
+
+The report is generated in the NDJSON format written by the plugin and read with
+'ReportReader', once only iterating over the results and once keeping all of them,
+as the TUI does. The peak memory is measured with tracemalloc, which slows both down.
+
+Usage::
+
+    python benchmarks/bench_report.py --tests 200000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.test_results import ReportReader, TestResult
+
+# Test modules and test functions the results are spread over
+MODULES = 50
+FUNCTIONS = 5000
+
+
+def generate_report(path: Path, count: int) -> None:
+    """Generate a report with the given number of parametrized test results."""
+    with Path.open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"root": str(path.parent)}) + "\n")
+        for i in range(count):
+            record: dict = {
+                "nodeid": f"tests/test_m{i % MODULES}.py::test_case_{i % FUNCTIONS}[{i}-add]",
+                "outcome": "failed" if i % 100 == 0 else "passed",
+                "duration": 0.0003,
+                "markers": ["api", "slow"],
+                "variant": f"{i}-add",
+            }
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def measure(report_path: Path, keep: bool) -> tuple[float, int, int]:
+    """Read the report, get the time, the peak memory and the memory left in bytes."""
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    # Without keeping the results, the deque consumes them without holding any
+    results: deque[TestResult] = deque(ReportReader(report_path), maxlen=None if keep else 0)
+    elapsed: float = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return elapsed, peak, current
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=200_000, help="Number of test results")
+    args = parser.parse_args()
+
+    # The reader logs at the debug level, which is not what is measured
+    logger.remove()
+
+    with tempfile.TemporaryDirectory() as directory:
+        report_path = Path(directory) / "pytest_report.ndjson"
+        generate_report(report_path, args.tests)
+        size: int = report_path.stat().st_size
+        print(f"Reading a report of {args.tests} tests ({size / 2**20:.0f} MB)")
+        for keep in (False, True):
+            elapsed, peak, current = measure(report_path, keep)
+            print(
+                f"  {'keeping' if keep else 'iterating':9} the results: {elapsed:6.2f}s, "
+                f"peak {peak / 2**20:4.0f} MB, kept {current / 2**20:4.0f} MB",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,6 @@ import click
 
 from pytest_tui_runner.logging import logger, setup_logger
 from pytest_tui_runner.paths import Paths, find_project_root_by_folder
-from pytest_tui_runner.ui.tui.app import TestRunnerApp
 
 
 @click.group()
@@ -23,7 +22,21 @@ def cli() -> None:
     default=False,
     help="Creates a library folder and config file in the current directory.",
 )
-def run(project_path: str | None, init: bool) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of pytest processes running the selected tests in parallel.",
+)
+@click.option(
+    "--warm-worker",
+    is_flag=True,
+    default=False,
+    help="Keep a pytest process with the tests already imported and fork each run from it.",
+)
+def run(project_path: str | None, init: bool, workers: int, warm_worker: bool) -> None:
     """Run the terminal application."""
     try:
         if project_path:
@@ -50,8 +63,11 @@ def run(project_path: str | None, init: bool) -> None:
         logger.debug("---------------------- APPLICATION PREPARATION ----------------------")
         logger.info(f"Path to user's project found: '{root}'")
 
+        # The UI layer is imported only here, so the pytest plugin never loads Textual
+        from pytest_tui_runner.ui.tui.app import TestRunnerApp  # noqa: PLC0415
+
         logger.info("▶️ Starting the application...")
-        app = TestRunnerApp()
+        app = TestRunnerApp(workers=workers, use_warm_worker=warm_worker)
         app.run()
 
     except subprocess.CalledProcessError as e:
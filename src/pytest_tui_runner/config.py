@@ -1,20 +1,30 @@
+import hashlib
 import json
+import marshal
+import sys
 from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 import yaml
 
 from pytest_tui_runner.logging import logger
+from pytest_tui_runner.paths import Paths
+from pytest_tui_runner.utils.types import config_validator
 from pytest_tui_runner.utils.types.config import TestConfig
 from pytest_tui_runner.utils.types.config_validator import Config
 
+# Bump when the structure stored in the compiled config cache changes
+CONFIG_CACHE_VERSION = 1
+
 
 @lru_cache(maxsize=1)
 def load_config(file_path: str) -> TestConfig:
     """Load and parse a configuration file.
 
     The result is cached, so repeated calls with the same file_path return the same object
-    without re-reading the file.
+    without re-reading the file. Across processes, the parsed and validated config is reused
+    from the compiled config cache for as long as the content of the file does not change.
     """
     path = Path(file_path)
 
@@ -25,17 +35,74 @@ You can run the application with the '--init' option to create a default configu
 
     logger.debug(f"Config file path set to: '{file_path}'")
 
+    source: bytes = path.read_bytes()
+    digest: str = config_digest(path, source)
+
+    cached: TestConfig | None = read_config_cache(Paths.config_cache(), digest)
+    if cached is not None:
+        logger.debug("Config loaded from the compiled config cache")
+        return cached
+
     if path.suffix in {".yaml", ".yml"}:
         logger.debug("Parsing as YAML")
-        with Path.open(path, encoding="utf-8") as file:
-            raw = yaml.safe_load(file)
+        raw = yaml.safe_load(source)
     elif path.suffix == ".json":
         logger.debug("Parsing as JSON")
-        with Path.open(path, encoding="utf-8") as file:
-            raw = json.load(file)
+        raw = json.loads(source)
     else:
         logger.error(f"Invalid config file format: '{path.suffix}'")
         raise ValueError("Only YAML and JSON files are supported.")
 
     Config.model_validate(raw)
+    write_config_cache(Paths.config_cache(), digest, raw)
     return raw
+
+
+def config_digest(path: Path, source: bytes) -> str:
+    """Get the key of the compiled config cache for the given config file content."""
+    digest = hashlib.blake2b(source, digest_size=16)
+    # The marshal format may differ between Python versions
+    digest.update(f"{path.resolve()}|{sys.version_info[:2]}|{CONFIG_CACHE_VERSION}".encode())
+    digest.update(validation_rules_digest().encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def validation_rules_digest() -> str:
+    """Get the key of the rules validating the config, so an upgrade validates it again.
+
+    A source checkout keeps its version while the rules change, so the module
+    with the rules is hashed together with the installed version of the package.
+    """
+    try:
+        package_version: str = version("pytest-tui-runner")
+    except PackageNotFoundError:
+        package_version = "unknown"
+
+    digest = hashlib.blake2b(Path(config_validator.__file__).read_bytes(), digest_size=16)
+    digest.update(package_version.encode())
+    return digest.hexdigest()
+
+
+def read_config_cache(cache_path: Path, digest: str) -> TestConfig | None:
+    """Get the validated config from the compiled config cache, if it matches the digest."""
+    try:
+        # Reading the whole file first is much faster than letting marshal read it piecewise
+        cached_digest, config = marshal.loads(cache_path.read_bytes())  # noqa: S302
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if cached_digest != digest:
+        logger.debug("Config file has changed since it was cached")
+        return None
+    return config
+
+
+def write_config_cache(cache_path: Path, digest: str, config: TestConfig) -> None:
+    """Store the validated config in the compiled config cache."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(marshal.dumps((digest, config)))
+    except (OSError, ValueError) as e:
+        # ValueError means the YAML contained values marshal cannot store, e.g. dates
+        logger.warning(f"Failed to write the compiled config cache: {e}")
@@ -1,192 +1,191 @@
+from pathlib import Path
+
 import pytest
 from _pytest.config.argparsing import Parser
 from _pytest.python import Metafunc
 
-from pytest_tui_runner.config import load_config
 from pytest_tui_runner.logging import logger, setup_logger
 from pytest_tui_runner.paths import Paths
-from pytest_tui_runner.utils.config import iter_tests
-from pytest_tui_runner.utils.pytest.arguments import format_test_flag
-from pytest_tui_runner.utils.pytest.encoding import decode_variants
-from pytest_tui_runner.utils.test_results import IGNORED_MARKERS
-from pytest_tui_runner.utils.types.config import Test, TestConfig
+from pytest_tui_runner.utils.outcomes import OutcomeHistory
+from pytest_tui_runner.utils.pytest.collection_cache import CollectionCache
+from pytest_tui_runner.utils.pytest.live_results import ResultSender
+from pytest_tui_runner.utils.pytest.manifest import (
+    MANIFEST_KEY,
+    MANIFEST_OPTION,
+    REPORT_OPTION,
+    SelectionManifest,
+)
+from pytest_tui_runner.utils.pytest.parametrize import PARAMETRIZE_KEY, ParametrizeTable
+from pytest_tui_runner.utils.pytest.records import RECORDER_PLUGIN, ResultRecorder
+from pytest_tui_runner.utils.pytest.selection import SELECTION_KEY, Selection
+from pytest_tui_runner.utils.pytest.work_queue import WORK_QUEUE_KEY, WorkQueueClient
 
 
 def pytest_addoption(parser: Parser) -> None:
-    """Add custom command-line options to pytest based on the user configuration."""
-    # After running the test as a new process, it is necessary to set up the logger again.
-    # This is the first function called when the test is run, so it's here
-    setup_logger()
-    logger.debug("---------------------------- PYTEST HOOKS ----------------------------")
-    logger.debug("▶️ ADD OPTIONS hook")
-
-    config: TestConfig = load_config(Paths.config())
-
-    for test in iter_tests(config):
-        option_name: str = format_test_flag(test["label"])
-
-        # Special test with arguments
-        if "arguments" in test:
-            logger.debug(f"Adding option with arguments = '{option_name}'")
-            parser.addoption(
-                option_name,
-                action="store",
-                help=f"Run '{test['label']}' test with arguments",
-            )
-        else:
-            logger.debug(f"Adding basic option = '{option_name}'")
-            parser.addoption(
-                option_name,
-                action="store_true",
-                default=False,
-                help=f"Run '{test['label']}' test",
-            )
-
-    logger.debug("✅ ADD OPTIONS hook")
-    logger.debug("-------------------------------------------------")
+    """Add the options through which the TUI passes the selected tests to pytest."""
+    parser.addoption(
+        MANIFEST_OPTION,
+        action="store",
+        default=None,
+        help="Run the tests selected in pytest-tui-runner, as written to this manifest file",
+    )
+    parser.addoption(
+        REPORT_OPTION,
+        action="store",
+        default=None,
+        help="Write the results of the tests for pytest-tui-runner to this NDJSON file",
+    )
 
 
 def pytest_generate_tests(metafunc: Metafunc) -> None:
-    """Dynamically parametrize tests based on the user configuration and command-line options."""
-    test_name = metafunc.function.__name__
-    logger.debug(f"▶️ GENERATE TESTS hook for '{(test_name)}' test")
-
-    config_data: TestConfig = load_config(Paths.config())
+    """Dynamically parametrize tests with the argument variants from the selection manifest."""
+    table: ParametrizeTable | None = metafunc.config.stash.get(PARAMETRIZE_KEY, None)
+    if table is None:
+        return
 
-    for test_def in iter_tests(config_data):
-        if "arguments" not in test_def:
-            continue
+    parametrization = table.lookup(metafunc)
+    if parametrization is None:
+        return
 
-        if not compare_test(metafunc, test_def):
-            continue
+    logger.debug(
+        f"Parametrizing '{metafunc.function.__name__}' with {len(parametrization.values)} "
+        f"variants of '{parametrization.label}'",
+    )
+    metafunc.parametrize(parametrization.names, parametrization.values, ids=parametrization.ids)
 
-        logger.debug("❗ FOUND TEST TO PARAMETRIZE")
 
-        parametrize_test(metafunc, test_def)
+def pytest_configure(config: pytest.Config) -> None:
+    """Build the user's selection once, so the collection hooks only do lookups."""
+    # The plugin is registered for every pytest run, but it has nothing to do
+    # in runs that were not launched by the TUI, so it stays dormant there
+    if not Paths.is_set_by_runner():
         return
 
-    logger.debug("❌ TEST NOT PARAMETRIZED")
-
-
-def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # After running the test as a new process, it is necessary to set up the logger again.
+    # This is the first hook that needs it, so it's here
+    setup_logger()
+    logger.debug("---------------------------- PYTEST HOOKS ----------------------------")
+    logger.debug("▶️ CONFIGURE hook")
+
+    manifest_path: str | None = config.getoption(MANIFEST_OPTION)
+    if manifest_path:
+        logger.debug(f"Loading selection manifest from '{manifest_path}'")
+        manifest = SelectionManifest.read(Path(manifest_path))
+    else:
+        logger.warning("No selection manifest was given, no test will be selected")
+        manifest = SelectionManifest()
+
+    config.stash[MANIFEST_KEY] = manifest
+    config.stash[SELECTION_KEY] = Selection.from_manifest(manifest)
+    config.stash[PARAMETRIZE_KEY] = ParametrizeTable.from_manifest(manifest)
+
+    if manifest.queue and not config.option.collectonly:
+        logger.debug(f"Running as a parallel worker, pulling tests from '{manifest.queue}'")
+        config.stash[WORK_QUEUE_KEY] = WorkQueueClient(manifest.queue)
+
+    report_path: str | None = config.getoption(REPORT_OPTION)
+    if report_path and not config.option.collectonly:
+        sender: ResultSender | None = None
+        if manifest.results:
+            logger.debug(f"Sending the results of the tests to '{manifest.results}'")
+            sender = ResultSender(manifest.results)
+        config.pluginmanager.register(ResultRecorder(Path(report_path), sender), RECORDER_PLUGIN)
+    logger.debug("✅ CONFIGURE hook")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Disconnect from the work queue of the parallel run."""
+    client: WorkQueueClient | None = config.stash.get(WORK_QUEUE_KEY, None)
+    if client is not None:
+        client.close()
+
+
+def pytest_collection_modifyitems(
+    session: pytest.Session,
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
     """Modify the collected test items to run only those selected by the user."""
+    selection: Selection | None = config.stash.get(SELECTION_KEY, None)
+    if selection is None:
+        return
+
     logger.debug("-------------------------------------------------")
     logger.debug("▶️ COLLECTION MODIFYITEMS hook")
-    logger.debug(f"Test count before filtering = {len(items)}")
-
-    config_data: TestConfig = load_config(Paths.config())
-
-    # Go through the options given by pytest so we know which tests to run
-    enabled_marker_sets: list = []
-    enabled_tests_names: list = []
-    for test_def in iter_tests(config_data):
-        logger.debug(f"Checking test '{test_def['label']}' if it has been selected")
-
-        option_name: str = format_test_flag(test_def["label"])
-        opt_value = config.getoption(option_name)
-        if opt_value:
-            logger.debug(f"Pytest argument found = '{opt_value}'")
-
-            if "markers" in test_def:
-                marks = frozenset(test_def["markers"])
-                logger.debug(f"Adding marks to the list = {marks}")
-                enabled_marker_sets.append(marks)
-            elif "test_name" in test_def:
-                enabled_tests_names.append(test_def["test_name"])
-            else:
-                logger.error("Test definition has neither 'markers' nor 'test_name' field")
-        else:
-            logger.debug("No pytest argument was specified for this test.")
-            logger.debug("'Skipping'")
-
-    logger.debug(f"List of wanted marks = {enabled_marker_sets}")
-    logger.debug(f"List of wanted tests names = {enabled_tests_names}")
-
-    # Keep only selected tests
-    logger.debug("▶️ Filtering tests...")
-    filtered_items = []
-    for item in items:
-        test_name = item.name.split("[")[0]
-        item_marks = frozenset(m.name for m in item.iter_markers() if m.name not in IGNORED_MARKERS)
-
-        if item_marks in enabled_marker_sets:
-            logger.debug(f"Required marks found ({item_marks}), leaving the test '{test_name}'")
-            filtered_items.append(item)
-        elif test_name in enabled_tests_names:
-            logger.debug(f"Test name found ({test_name}), leaving the test '{test_name}'")
-            filtered_items.append(item)
-        else:
-            logger.debug("TEST SKIPPED")
-            logger.debug(f"Expected marks = {sorted(map(list, enabled_marker_sets))}")
-            logger.debug(f"Have = {sorted(item_marks)}")
-            logger.debug(f"Expected test name = {enabled_tests_names}")
-            logger.debug(f"Have = {test_name}")
-    items[:] = filtered_items
-    logger.debug("✅ Tests filtered")
-
-    logger.debug(f"Test count after filtering = {len(items)}")
-    logger.debug("✅ COLLECTION MODIFYITEMS hook")
 
-    # This is the last function to run when preparing the test, hence this log
-    logger.debug("---------------------------- PYTEST HOOKS ----------------------------")
-
-
-def compare_test(metafunc: Metafunc, test: Test) -> bool:
-    """Compare the given test definition with the current metafunc."""
-    if "markers" in test:
-        metafunc_markers: set[str] = {
-            marker.name
-            for marker in metafunc.definition.iter_markers()
-            if marker.name not in IGNORED_MARKERS
-        }
-
-        test_markers = set(test.get("markers", []))
-
-        if test_markers != metafunc_markers:
-            logger.debug(
-                f"WRONG 'marks' for test: {test['label']} ({metafunc_markers} != {test_markers})",
-            )
-            return False
-
-        logger.debug(f"'EXPECTED MARKS FOUND' = {metafunc_markers}")
-        return True
-
-    if "test_name" in test:
-        metafunc_test_name = metafunc.function.__name__
-        test_name = test["test_name"]
+    manifest: SelectionManifest = config.stash[MANIFEST_KEY]
+    if is_complete_collection(session, manifest):
+        logger.debug("Updating the collection cache")
+        CollectionCache.from_items(config.rootpath, items).write(Paths.collection_cache())
 
-        if metafunc_test_name != test_name:
-            logger.debug(f"WRONG 'test name' ({metafunc_test_name} != {test_name})")
-            return False
+    selected, deselected = selection.split(items)
 
-        logger.debug(f"'EXPECTED TEST NAME FOUND' = {metafunc_test_name}")
-        return True
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    if manifest.failed_first:
+        order_failed_first(config, selected)
+    items[:] = selected
 
-    logger.error("Test definition has neither 'markers' nor 'test_name' field")
-    return False
+    logger.info(
+        f"Selected {len(selected)} of {len(selected) + len(deselected)} collected tests "
+        f"({len(selection.marker_sets)} marker sets, {len(selection.test_names)} test names)",
+    )
+    logger.debug("✅ COLLECTION MODIFYITEMS hook")
 
+    # This is the last function to run when preparing the test, hence this log
+    logger.debug("---------------------------- PYTEST HOOKS ----------------------------")
 
-def parametrize_test(metafunc: Metafunc, test: Test) -> None:
-    """Parametrize the given metafunc based on the test definition."""
-    option_name = format_test_flag(test["label"])
-    option_value = metafunc.config.getoption(option_name)
 
-    if not option_value:
-        logger.debug("❌ NO ARGUMENTS PROVIDED")
+def is_complete_collection(session: pytest.Session, manifest: SelectionManifest) -> bool:
+    """Check if the session collected all tests of the TUI's project, to cache where they are.
+
+    A module that failed to import would be missing from the cache for good, and so would
+    the tests outside the paths or node IDs given on the command line. Sessions that only
+    inherited the environment of the TUI, e.g. nested pytester runs, collect other trees.
+    """
+    config: pytest.Config = session.config
+    return (
+        config.getoption(MANIFEST_OPTION) is not None
+        and config.rootpath.resolve() == Paths.user_root()
+        and config.args_source is not pytest.Config.ArgsSource.ARGS
+        and not manifest.from_cache
+        and not session.testsfailed
+    )
+
+
+def order_failed_first(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Reorder the selected items so the failed tests run first, then the new ones."""
+    history = OutcomeHistory.read(Paths.outcome_history())
+    if history.rootdir != str(config.rootpath):
+        logger.debug("No outcome history for this rootdir, keeping the collection order")
         return
 
-    variants: list[dict[str, str]] = decode_variants(option_value)
-    if not variants:
-        logger.error("Argument decoding returned nothing")
-        return
-
-    param_names = list(variants[0].keys())
-    param_values = [tuple(v[k] for k in param_names) for v in variants]
-
-    logger.debug(f"Parameters names = {param_names}")
-    logger.debug(f"Parameters values = {param_values}")
-
-    logger.debug("Executing parametrize function")
-    metafunc.parametrize(param_names, param_values)
-    logger.debug("✅ TEST SUCCESSFULLY PARAMETRIZED")
-    return
+    # The sort is stable, so the tests keep the collection order within each group
+    items.sort(key=lambda item: history.rank(item.nodeid))
+    logger.debug("Selected tests ordered failed first")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session: pytest.Session) -> bool | None:
+    """Run the tests pulled from the work queue, when running as a parallel worker.
+
+    Every worker collects all selected tests, but runs only those it gets from the queue.
+    Otherwise, pytest's own loop runs all the collected tests.
+    """
+    client: WorkQueueClient | None = session.config.stash.get(WORK_QUEUE_KEY, None)
+    if client is None:
+        return None
+
+    if session.testsfailed and not session.config.option.continue_on_collection_errors:
+        raise session.Interrupted(
+            f"{session.testsfailed} error{'s' if session.testsfailed != 1 else ''} "
+            "during collection",
+        )
+
+    for item, nextitem in client.iter_items(session.config.rootpath, session.items):
+        item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+    return True
@@ -1,17 +1,78 @@
+import json
+import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 from loguru import logger
 
 from pytest_tui_runner.paths import Paths
+from pytest_tui_runner.utils.channel.client import connect_channel
 
-__all__ = ["logger", "setup_logger"]
+if TYPE_CHECKING:
+    from loguru import Message
+
+__all__ = ["debug_enabled", "debug_lazy", "logger", "setup_logger"]
+
+# Severity of the terminal-only messages, between INFO and WARNING
+TERMINAL_LEVEL_NO = 25
+DEBUG_LEVEL_NO = 10
+
+# Lowest severity any handler writes, set by 'setup_logger'.
+# Until then, the default handler of loguru writes everything
+_min_level_no: int = 0
+
+
+def debug_enabled() -> bool:
+    """Check if any handler writes debug messages.
+
+    Messages below the configured level are dropped by loguru, but only after their
+    f-string was built. Guarding expensive messages with this check makes them free.
+    """
+    return _min_level_no <= DEBUG_LEVEL_NO
+
+
+def debug_lazy(message: str, *args: Callable[[], object]) -> None:
+    """Log a debug message whose arguments are only computed if the message is written.
+
+    The message is formatted with 'str.format', each argument is a function returning
+    the value to put in, e.g. ``debug_lazy("Loaded widgets = {}", lambda: widgets)``.
+    """
+    if _min_level_no <= DEBUG_LEVEL_NO:
+        logger.opt(lazy=True, depth=1).debug(message, *args)
+
+
+class LogSender:
+    """Sink sending the formatted log messages of a pytest process to the TUI.
+
+    Every message is one JSON line with its level and text, which the TUI writes
+    to the log file (see 'LogCollector').
+    """
+
+    def __init__(self, address: str) -> None:
+        """Connect to the log channel of the TUI."""
+        self._socket = connect_channel(address)
+
+    def write(self, message: "Message") -> None:
+        """Send one formatted message, called by loguru."""
+        level: str = message.record["level"].name
+        line: str = json.dumps({"level": level, "text": str(message)})
+        self._socket.sendall(f"{line}\n".encode())
+
+    def stop(self) -> None:
+        """Disconnect from the log channel, called by loguru when the sink is removed."""
+        self._socket.close()
 
 
 def setup_logger(clear_log_file: bool = False) -> None:
     """Configure the loguru logger with file and terminal handlers."""
-    Paths.log_dir().mkdir(parents=True, exist_ok=True)
+    global _min_level_no  # noqa: PLW0603
+
+    # The pytest processes launched by the TUI send their logs to it, so the TUI is
+    # the only process writing and rotating the log file
+    log_address: str | None = os.getenv(Paths.LOG_ENV_VAR) if Paths.is_set_by_runner() else None
 
     config = get_logger_config()
 
@@ -27,6 +88,7 @@ def setup_logger(clear_log_file: bool = False) -> None:
     level = config.get("level", "INFO")
     rotation = config.get("rotation", "00:00")
     retention = config.get("retention", 7)
+    aggregate = config.get("aggregate", True)
     # ---------------------------------
 
     # terminal log format
@@ -34,25 +96,46 @@ def setup_logger(clear_log_file: bool = False) -> None:
 
     # Remove default logger
     logger.remove()
+    level_no: int = level if isinstance(level, int) else logger.level(level).no
+    _min_level_no = min(level_no, TERMINAL_LEVEL_NO)
+
+    sender: LogSender | None = None
+    if aggregate and log_address:
+        try:
+            sender = LogSender(log_address)
+        except OSError as e:
+            logger.warning(f"Failed to connect to the log channel, writing the log file: {e}")
 
     # Add new logger with new log format
-    logger.add(
-        Paths.log_file(),
-        level=level,
-        format=log_format,
-        colorize=False,
-        backtrace=True,
-        diagnose=True,
-        enqueue=True,
-        filter=lambda record: record["level"].name != "TERMINAL",
-        rotation=rotation,
-        retention=retention,
-    )
+    if sender is not None:
+        logger.add(
+            sender,
+            level=level,
+            format=log_format,
+            colorize=False,
+            backtrace=True,
+            diagnose=True,
+            filter=lambda record: record["level"].name != "TERMINAL",
+        )
+    else:
+        Paths.log_dir().mkdir(parents=True, exist_ok=True)
+        logger.add(
+            Paths.log_file(),
+            level=level,
+            format=log_format,
+            colorize=False,
+            backtrace=True,
+            diagnose=True,
+            enqueue=True,
+            filter=lambda record: record["level"].name != "TERMINAL",
+            rotation=rotation,
+            retention=retention,
+        )
 
     # Register a custom log level for terminal output
     #
     # This defines a **custom log level** named "TERMINAL".
-    # - `no=25`: The numeric value of this level, which determines its severity.
+    # - `no=TERMINAL_LEVEL_NO`: The numeric value of this level, which determines its severity.
     #   Lower values mean less severe (more verbose), higher mean more critical.
     #   - e.g., DEBUG = 10, INFO = 20, WARNING = 30.
     #   - 25 is between INFO (20) and WARNING (30), so "TERMINAL" will show messages
@@ -63,7 +146,7 @@ def setup_logger(clear_log_file: bool = False) -> None:
     # To log a message at this custom level, use:
     #     logger.log("TERMINAL", "This message is for the terminal only.")
     try:
-        logger.level("TERMINAL", no=25, color="<blue>")
+        logger.level("TERMINAL", no=TERMINAL_LEVEL_NO, color="<blue>")
 
         # Add special logger for terminal
         logger.add(
@@ -83,7 +166,11 @@ def setup_logger(clear_log_file: bool = False) -> None:
 
 
 def get_logger_config() -> dict:
-    """Get the content of the log configuration file if it exists."""
+    """Get the log configuration passed by the TUI, or the content of its file if it exists."""
+    passed: str | None = os.getenv(Paths.LOG_CONFIG_ENV_VAR)
+    if passed is not None and Paths.is_set_by_runner():
+        return json.loads(passed)
+
     config_file = Paths.log_config_file()
     if config_file.is_file():
         try:
@@ -20,6 +20,18 @@ class Paths:
     # information such as widget status and logs. Then the main configuration will also be loaded from there.
     APP_FOLDER = ".pytest_tui_runner"
 
+    # Environment variable through which the TUI passes the user project root to pytest.
+    # pytest processes without it were not launched by the TUI
+    ROOT_ENV_VAR = "PYTEST_TUI_RUNNER_ROOT"
+
+    # Environment variable with the address of the log channel of the TUI.
+    # pytest processes that have it send their logs to the TUI instead of writing the log file
+    LOG_ENV_VAR = "PYTEST_TUI_RUNNER_LOGS"
+
+    # Environment variable with the log configuration read by the TUI, as JSON.
+    # pytest processes that send their logs to the TUI then never touch the log files
+    LOG_CONFIG_ENV_VAR = "PYTEST_TUI_RUNNER_LOG_CONFIG"
+
     # user project root (to be set dynamically from CLI)
     _user_root: Path | None = None
 
@@ -36,12 +48,17 @@ class Paths:
         if cls._user_root is not None:
             return cls._user_root
 
-        env_root = os.getenv("PYTEST_TUI_RUNNER_ROOT")
+        env_root = os.getenv(cls.ROOT_ENV_VAR)
         if env_root:
             return Path(env_root).resolve()
 
         raise RuntimeError("User project root is not set yet.")
 
+    @classmethod
+    def is_set_by_runner(cls) -> bool:
+        """Check if the user project root was passed by the TUI runner to this process."""
+        return cls.ROOT_ENV_VAR in os.environ
+
     @classmethod
     def app_dir(cls) -> Path:
         """Path to the main application directory in the user's project."""
@@ -54,11 +71,26 @@ class Paths:
         """Path to the user configuration file."""
         return cls.app_dir() / "config.yaml"
 
+    @classmethod
+    def config_cache(cls) -> Path:
+        """Path to the parsed and validated user configuration, stored in a binary format."""
+        return cls.app_dir() / "cache" / "config.marshal"
+
     @classmethod
     def log_dir(cls) -> Path:
         """Directory for log files."""
         return cls.app_dir() / "logs"
 
+    @classmethod
+    def terminal_dir(cls) -> Path:
+        """Directory for the output of the runs shown in the terminal."""
+        return cls.app_dir() / "terminal"
+
+    @classmethod
+    def terminal_output(cls, index: int) -> Path:
+        """Path to the output of one run of the session, spilled from the terminal."""
+        return cls.terminal_dir() / f"run_{index}.txt"
+
     @classmethod
     def state_file(cls) -> Path:
         """Path to the file where the state of widgets is stored."""
@@ -74,10 +106,35 @@ class Paths:
         """Path to the log configuration file."""
         return cls.log_dir() / "config.yaml"
 
+    @classmethod
+    def selection_manifest(cls) -> Path:
+        """Path to the manifest with the tests selected for the current run."""
+        return cls.app_dir() / "results" / "selection.json"
+
+    @classmethod
+    def collection_cache(cls) -> Path:
+        """Path to the cache mapping the config's tests to the node IDs of the collected tests."""
+        return cls.app_dir() / "cache" / "collection.json"
+
+    @classmethod
+    def duration_history(cls) -> Path:
+        """Path to the durations of the tests from the previous runs."""
+        return cls.app_dir() / "history" / "durations.json"
+
+    @classmethod
+    def outcome_history(cls) -> Path:
+        """Path to the last outcomes of the tests from the previous runs."""
+        return cls.app_dir() / "history" / "outcomes.json"
+
     @classmethod
     def pytest_report(cls) -> Path:
-        """Path to the JSON report generated by pytest-json-report plugin."""
-        return cls.app_dir() / "results" / "pytest_report.json"
+        """Path to the NDJSON report with one record per test, written by the plugin."""
+        return cls.app_dir() / "results" / "pytest_report.ndjson"
+
+    @classmethod
+    def worker_report(cls, index: int) -> Path:
+        """Path to the NDJSON report of one worker of a parallel run."""
+        return cls.app_dir() / "results" / f"pytest_report_worker_{index}.ndjson"
 
     # ------------------ DELETE METHODS ------------------
 
@@ -4,6 +4,7 @@ from textual.widgets import TabbedContent, TabPane
 from pytest_tui_runner.logging import logger
 from pytest_tui_runner.ui.tui.pages.terminal_view import TerminalView
 from pytest_tui_runner.ui.tui.pages.tests_view import TestsView
+from pytest_tui_runner.utils.channel.logs import LogCollector
 
 
 class TestRunnerApp(App):
@@ -14,6 +15,31 @@ class TestRunnerApp(App):
 
     CSS_PATH = "styles/tests_view.css"
 
+    def __init__(self, workers: int = 1, use_warm_worker: bool = False) -> None:
+        """Initialize the application.
+
+        Parameters
+        ----------
+        workers : int
+            Initial number of pytest processes running the tests in parallel.
+        use_warm_worker : bool
+            Whether single-process runs are forked from a pre-started pytest process.
+
+        """
+        super().__init__()
+        self.test_workers: int = workers
+        self.use_warm_worker: bool = use_warm_worker
+        self.log_collector = LogCollector()
+
+    async def on_load(self) -> None:
+        """Start collecting the logs of the pytest processes before any of them is started."""
+        await self.log_collector.__aenter__()
+        logger.debug(f"Collecting the logs of pytest processes on '{self.log_collector.address}'")
+
+    async def on_unmount(self) -> None:
+        """Write the rest of the logs of the pytest processes and stop collecting them."""
+        await self.log_collector.__aexit__(None, None, None)
+
     def compose(self) -> ComposeResult:
         """Compose the main layout with tabbed views for Tests and Terminal."""
         # Uncomment this if you want to have Header on the page
@@ -2,19 +2,52 @@ import asyncio
 import os
 from asyncio.subprocess import Process
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import pytest
+from textual.widget import Widget
 from textual.widgets import Button
 
 from pytest_tui_runner.logging import logger
 from pytest_tui_runner.paths import Paths
 from pytest_tui_runner.ui.tui.pages.terminal_view import TerminalView
-from pytest_tui_runner.utils.pytest.arguments import build_pytest_arguments
-from pytest_tui_runner.utils.types.widgets import WidgetsDict
+from pytest_tui_runner.utils.channel.results import ResultStream
+from pytest_tui_runner.utils.channel.work_queue import WorkQueue
+from pytest_tui_runner.utils.durations import DurationHistory
+from pytest_tui_runner.utils.outcomes import OutcomeHistory
+from pytest_tui_runner.utils.pytest.arguments import (
+    build_collect_arguments,
+    build_pytest_arguments,
+    pytest_command,
+)
+from pytest_tui_runner.utils.pytest.collection_cache import cached_node_ids, collection_args
+from pytest_tui_runner.utils.pytest.manifest import SelectionManifest
+from pytest_tui_runner.utils.pytest.output import read_output_lines
+from pytest_tui_runner.utils.pytest.warm_worker import WarmWorker
+from pytest_tui_runner.utils.result_index import ResultIndex
+from pytest_tui_runner.utils.test_results import (
+    ReportReader,
+    TestResult,
+    merge_reports,
+)
 from pytest_tui_runner.utils.widgets.buttons import (
     disable_buttons_after_test_runs,
     enable_buttons_after_test_finnished,
 )
-from pytest_tui_runner.utils.widgets.marking import mark_widgets_from_report, reset_widgets_style
+from pytest_tui_runner.utils.widgets.marking import (
+    get_test_result,
+    mark_widgets_from_new_results,
+    mark_widgets_from_results,
+    reset_widgets_style,
+)
+from pytest_tui_runner.utils.widgets.registry import RegisteredTest, WidgetRegistry
+from pytest_tui_runner.utils.widgets.selection import extract_widget_selection
+
+if TYPE_CHECKING:
+    from pytest_tui_runner.utils.types.widgets import TestArguments
+
+# How often the widgets are marked with the results that arrived during a run, in seconds
+LIVE_MARKING_INTERVAL = 0.25
 
 
 class ButtonHandler:
@@ -22,15 +55,25 @@ class ButtonHandler:
 
     Attributes
     ----------
-    widgets : dict
-        Dictionary of widgets representing test options.
+    registry : WidgetRegistry
+        Registry of the widgets representing test options and their test definitions.
     terminal_view
         The terminal view interface for displaying output.
+    workers : int
+        Number of pytest processes running the tests in parallel.
+    failed_first : bool
+        Whether the tests that failed in the previous runs run first, then the new ones.
+    exitfirst : bool
+        Whether the run stops at the first failed test.
+    warm_worker : WarmWorker | None
+        Pre-started pytest process that runs the single-process runs, if enabled.
 
     Methods
     -------
     run_tests()
         Initiates running tests asynchronously.
+    result_of(widget)
+        Gets the result of the last run shown by a widget.
     check_all()
         Checks all test option widgets.
     uncheck_all()
@@ -40,23 +83,36 @@ class ButtonHandler:
 
     def __init__(
         self,
-        widgets: WidgetsDict,
+        registry: WidgetRegistry,
         buttons: list[Button],
         terminal_view: TerminalView,
+        workers: int = 1,
+        warm_worker: WarmWorker | None = None,
     ) -> None:
         """Initialize ButtonHandler with widgets and terminal view.
 
         Parameters
         ----------
-        widgets : dict
-            Dictionary of widgets representing test options.
+        registry : WidgetRegistry
+            Registry of the widgets representing test options and their test definitions.
         terminal_view
             The terminal view interface for displaying output.
+        workers : int
+            Number of pytest processes running the tests in parallel.
+        warm_worker : WarmWorker | None
+            Pre-started pytest process that runs the single-process runs, if enabled.
 
         """
-        self.widgets: WidgetsDict = widgets
+        self.registry: WidgetRegistry = registry
         self.buttons: list[Button] = buttons
         self.terminal_view: TerminalView = terminal_view
+        self.workers: int = workers
+        self.failed_first: bool = False
+        self.exitfirst: bool = False
+        self.warm_worker: WarmWorker | None = warm_worker
+        self._live_results: list[TestResult] = []
+        self._new_results: list[TestResult] = []
+        self._result_index = ResultIndex()
 
     def run_tests(self) -> None:
         """Initiate running tests asynchronously.
@@ -64,7 +120,7 @@ class ButtonHandler:
         This method schedules the asynchronous test runner to execute in the event loop.
         """
         logger.debug("Resetting widget styles")
-        reset_widgets_style(self.widgets)
+        reset_widgets_style(self.registry)
         Paths.delete_pytest_report()
 
         logger.debug("------------------------- COMMAND EXECUTING -------------------------")
@@ -73,16 +129,85 @@ class ButtonHandler:
         self._test_task = asyncio.create_task(self._run_tests_async())
 
     async def _run_tests_async(self) -> None:
+        self.terminal_view.start_run()
         if not self._validate_test_path(Paths.user_root()):
             return
 
-        logger.debug("▶️ Building command to run tests...")
-        args: list[str] = self._build_test_command()
-        logger.debug("✅ Command built")
+        self._write_header()
+        logger.debug("Disabling buttons during test run")
+        await disable_buttons_after_test_runs(self.buttons)
 
-        logger.debug("Executing command")
-        logger.debug("------------------------- COMMAND EXECUTING -------------------------")
-        await self._execute_test_process(args, cwd=Paths.user_root())
+        live_marking: asyncio.Task | None = None
+        try:
+            manifest: SelectionManifest = extract_widget_selection(self.registry)
+            manifest.failed_first = self.failed_first
+
+            self._live_results = []
+            self._new_results = []
+            self._result_index = ResultIndex()
+            async with ResultStream(self._new_results.append) as stream:
+                manifest.results = stream.address
+                live_marking = asyncio.create_task(self._mark_live_results())
+                if self.workers > 1:
+                    await self._run_parallel(manifest)
+                else:
+                    await self._run_single(manifest)
+            logger.info("✅ Tests finished")
+        finally:
+            # Also when the run fails, so the TUI can run the tests again
+            if live_marking is not None:
+                live_marking.cancel()
+            logger.debug("Enabling buttons after test run")
+            await enable_buttons_after_test_finnished(self.buttons)
+
+        logger.debug("------------------------- RESULTS EVALUATION -------------------------")
+        self._mark_new_results()
+        rootdir: str = stream.rootdir
+        test_results: list[TestResult] = self._live_results
+        if not test_results:
+            # The results did not arrive through the channel, so the report is used instead
+            logger.debug("▶️ Reading test results from report...")
+            reader = ReportReader(Paths.pytest_report())
+            test_results = list(reader)
+            rootdir = reader.rootdir
+            logger.debug("✅ Test results read")
+
+            logger.debug("▶️ Marking widgets according to the result...")
+            self._result_index = ResultIndex(test_results)
+            mark_widgets_from_results(self.registry, self._result_index)
+            logger.debug("✅ Widgets marked")
+
+        DurationHistory.record(Paths.duration_history(), rootdir, test_results)
+        OutcomeHistory.record(Paths.outcome_history(), rootdir, test_results)
+        logger.info("Results evaluated")
+        logger.debug("------------------------- RESULTS EVALUATION -------------------------")
+
+    def result_of(self, widget: Widget) -> TestResult | None:
+        """Get the result of the last run shown by a widget, if it belongs to a test."""
+        found: tuple[RegisteredTest, Widget | TestArguments] | None = self.registry.find(widget)
+        if found is None or found[0].key is None:
+            return None
+
+        registered, test = found
+        return get_test_result(test, registered.key, self._result_index)
+
+    async def _mark_live_results(self) -> None:
+        """Mark the widgets with the results of the finished tests until the run ends."""
+        while True:
+            await asyncio.sleep(LIVE_MARKING_INTERVAL)
+            self._mark_new_results()
+
+    def _mark_new_results(self) -> None:
+        """Mark the widgets with the results that arrived since the last call."""
+        if not self._new_results:
+            return
+
+        new_results: list[TestResult] = self._new_results[:]
+        self._new_results.clear()
+        self._live_results.extend(new_results)
+        self._result_index.add(new_results)
+        logger.debug(f"Marking widgets with {len(new_results)} new results")
+        mark_widgets_from_new_results(self.registry, new_results, self._result_index)
 
     def _validate_test_path(self, path: Path) -> bool:
         """Check if test path exists."""
@@ -92,12 +217,106 @@ class ButtonHandler:
             return False
         return True
 
-    def _build_test_command(self) -> list[str]:
-        """Build the pytest command arguments."""
-        return build_pytest_arguments(self.widgets)
+    async def _run_single(self, manifest: SelectionManifest) -> None:
+        """Run the selected tests in a single pytest process."""
+        logger.debug("▶️ Building command to run tests...")
+        node_ids: list[str] = cached_node_ids(manifest, Paths.collection_cache())
+        manifest.from_cache = bool(node_ids)
+
+        manifest_path: Path = Paths.selection_manifest()
+        manifest.write(manifest_path)
+        args: list[str] = build_pytest_arguments(
+            manifest_path,
+            collection_args(node_ids),
+            exitfirst=self.exitfirst,
+        )
+        logger.debug("✅ Command built")
+
+        logger.debug("Executing command")
+        logger.debug("------------------------- COMMAND EXECUTING -------------------------")
+        if self.warm_worker is not None:
+            logger.debug("▶️ Running tests in the warm worker...")
+            return_code: int | None = await self.warm_worker.run(
+                args[len(pytest_command()) :],
+                self.terminal_view.write_line,
+                self.terminal_view.drain,
+            )
+            if return_code is not None:
+                logger.debug(f"✅ Warm worker finished with exit code {return_code}")
+                return
+            logger.debug("Warm worker is not available, running tests in a new process")
+
+        await self._execute_test_process(args, cwd=Paths.user_root())
+
+    async def _run_parallel(self, manifest: SelectionManifest) -> None:
+        """Run the selected tests in several pytest processes sharing one work queue.
+
+        The units of work are the node IDs of the selected tests, longest first according
+        to the duration history. Each worker collects all of them, but runs only the units
+        it pulls from the queue, so a worker that finishes early keeps taking work until
+        the queue is empty.
+        """
+        manifest_path: Path = Paths.selection_manifest()
+        node_ids: list[str] = cached_node_ids(manifest, Paths.collection_cache())
+        if not node_ids:
+            # The work is split by node IDs, so the collection cache has to be refreshed first
+            logger.debug("▶️ Collecting tests to split them between workers...")
+            manifest.write(manifest_path)
+            await self._execute_test_process(
+                build_collect_arguments(manifest_path),
+                cwd=Paths.user_root(),
+                quiet=True,
+            )
+            node_ids = cached_node_ids(manifest, Paths.collection_cache())
+            logger.debug("✅ Tests collected")
+
+        if not node_ids:
+            logger.warning("The tests cannot be split between workers, running them in one process")
+            await self._run_single(manifest)
+            return
+
+        # Starting the longest tests first keeps one of them from running alone at the end
+        node_ids = DurationHistory.read(Paths.duration_history()).longest_first(node_ids)
+        if self.failed_first:
+            node_ids = OutcomeHistory.read(Paths.outcome_history()).failed_units_first(node_ids)
+
+        workers: int = min(self.workers, len(node_ids))
+        report_paths: list[Path] = [Paths.worker_report(i) for i in range(workers)]
+        for report_path in report_paths:
+            report_path.unlink(missing_ok=True)
+
+        async with WorkQueue(node_ids) as queue:
+            manifest.from_cache = True
+            manifest.queue = queue.address
+            manifest.write(manifest_path)
+
+            logger.info(f"Running {len(node_ids)} tests in {workers} workers")
+            args: list[str] = collection_args(node_ids)
 
-    async def _execute_test_process(self, args: list[str], cwd: Path) -> None:
-        """Run a subprocess for tests and stream output to terminal."""
+            async def run_worker(index: int, report_path: Path) -> None:
+                return_code: int = await self._execute_test_process(
+                    build_pytest_arguments(
+                        manifest_path,
+                        args,
+                        report_path=report_path,
+                        exitfirst=self.exitfirst,
+                    ),
+                    cwd=Paths.user_root(),
+                    prefix=f"[w{index + 1}] ",
+                )
+                # '-x' stops only the failed worker, the others stop after their current unit
+                if self.exitfirst and return_code == pytest.ExitCode.TESTS_FAILED:
+                    logger.debug(f"Worker {index + 1} failed, no more tests will be started")
+                    queue.units.clear()
+
+            await asyncio.gather(
+                *(run_worker(i, report_path) for i, report_path in enumerate(report_paths)),
+            )
+
+        merge_reports(report_paths, Paths.pytest_report())
+
+    def _write_header(self) -> None:
+        """Write the header of a test run to the terminal."""
         self.terminal_view.write_line("\n")
         self.terminal_view.write_line(
             "==============================================================================\n",
@@ -112,12 +331,36 @@ class ButtonHandler:
             style="#F39D2D",
         )
 
-        logger.debug("Disabling buttons during test run")
-        await disable_buttons_after_test_runs(self.buttons)
+    async def _execute_test_process(
+        self,
+        args: list[str],
+        cwd: Path,
+        prefix: str = "",
+        *,
+        quiet: bool = False,
+    ) -> int:
+        """Run a subprocess for tests and stream output to terminal.
+
+        Parameters
+        ----------
+        args : list[str]
+            Command to run.
+        cwd : Path
+            Working directory of the process.
+        prefix : str, optional
+            Text put before every line of the output, to tell the workers apart.
+        quiet : bool, optional
+            If True, the output is only logged and not written to the terminal.
+
+        Returns
+        -------
+        int
+            Return code of the process.
 
+        """
         process: Process = await asyncio.create_subprocess_exec(
             *args,
-            env={**os.environ, "PYTEST_TUI_RUNNER_ROOT": str(Paths.user_root())},
+            env={**os.environ, Paths.ROOT_ENV_VAR: str(Paths.user_root())},
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
             cwd=cwd,
@@ -127,24 +370,26 @@ class ButtonHandler:
             raise RuntimeError("Process stdout is not available.")
 
         logger.debug("Starting to write output to terminal")
-        await self._stream_process_output(process)
-
-        await process.wait()
-        logger.info("✅ Tests finished")
+        await self._stream_process_output(process, prefix, quiet=quiet)
 
-        logger.debug("Enabling buttons after test run")
-        await enable_buttons_after_test_finnished(self.buttons)
+        return await process.wait()
 
-        logger.debug("------------------------- RESULTS EVALUATION -------------------------")
-        logger.debug("▶️ Marking widgets according to the result...")
-        mark_widgets_from_report(self.widgets, Paths.pytest_report())
-        logger.debug("✅ Widgets marked")
-        logger.info("Results evaluated")
-        logger.debug("------------------------- RESULTS EVALUATION -------------------------")
-
-    async def _stream_process_output(self, process: Process) -> None:
-        """Stream process stdout to terminal line by line."""
+    async def _stream_process_output(
+        self,
+        process: Process,
+        prefix: str = "",
+        *,
+        quiet: bool = False,
+    ) -> None:
+        """Stream process stdout to terminal, chunk by chunk."""
         if process.stdout is None:
             raise RuntimeError("Process stdout is not available.")
-        async for line in process.stdout:
-            self.terminal_view.write_line(line.decode(errors="replace").rstrip())
+        async for lines in read_output_lines(process.stdout):
+            if quiet:
+                for line in lines:
+                    logger.debug(line)
+                continue
+
+            for line in lines:
+                self.terminal_view.write_line(f"{prefix}{line}")
+            await self.terminal_view.drain()
@@ -2,7 +2,7 @@ from textual.containers import Horizontal, Vertical
 from textual.widget import Widget
 from textual.widgets import Button, Input, Select
 
-from pytest_tui_runner.logging import logger
+from pytest_tui_runner.logging import debug_lazy, logger
 
 
 class SpecialTestGroup(Vertical):
@@ -30,8 +30,8 @@ class SpecialTestGroup(Vertical):
         self.rows: list[Horizontal] = []
 
         logger.debug(f"Widgets len after clonning = '{len(initial_rows)}'")
-        logger.debug(f"Pointer to widgets = {self.original_input}")
-        logger.debug(f"Row template = {self.row_template}")
+        debug_lazy("Pointer to widgets = {}", lambda: self.original_input)
+        debug_lazy("Row template = {}", lambda: self.row_template)
 
     async def on_mount(self) -> None:
         """Mounts the initial rows and refreshes the control buttons when the widget is added to the app."""
@@ -49,7 +49,7 @@ class SpecialTestGroup(Vertical):
         if debug_counter != 0:
             logger.error("The original widget list was modified when adding rows")
 
-        logger.debug(f"Generated rows = {self.rows}")
+        debug_lazy("Generated rows = {}", lambda: self.rows)
         logger.debug(f"Widgets len after generating rows = '{len(self.original_input)}'")
         logger.debug("✅ SpecialTestGroup mounted")
 
@@ -0,0 +1,56 @@
+from collections.abc import Iterator
+from typing import ClassVar
+
+from textual.binding import BindingType
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widget import Widget
+from textual.widgets import TextArea
+
+from pytest_tui_runner.utils.test_results import TestResult
+
+
+class OutputView(ModalScreen):
+    """A page over the tests showing the output captured in one test.
+
+    The output is read from the output spool of the run only when the page opens,
+    so the results of the tests never hold their output in memory.
+    """
+
+    DEFAULT_CSS = """
+    OutputView {
+        align: center middle;
+    }
+
+    #output_container {
+        width: 90%;
+        height: 90%;
+        border: round rgb(109, 71, 0);
+        border-title-color: rgb(243, 157, 45);
+        border-subtitle-color: rgb(243, 157, 45);
+        background: rgb(18, 18, 18);
+    }
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [("escape", "dismiss", "Close")]
+
+    def __init__(self, test_result: TestResult, output: str) -> None:
+        """Initialize the page with a test result and the output read for it."""
+        super().__init__()
+        self.test_result: TestResult = test_result
+        self.output: str = output
+
+    def compose(self) -> Iterator[Widget]:
+        """Compose the read-only text area with the output.
+
+        Yields
+        ------
+        Widget
+            The container of the text area, titled with the test and its outcome.
+
+        """
+        container = Vertical(id="output_container")
+        container.border_title = self.test_result.nodeid or self.test_result.test_name or ""
+        container.border_subtitle = f"{self.test_result.outcome} (esc to close)"
+        with container:
+            yield TextArea(self.output, read_only=True, id="output")
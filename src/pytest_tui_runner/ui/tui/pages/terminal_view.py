@@ -1,13 +1,86 @@
+import asyncio
+import re
+from collections import deque
 from collections.abc import Iterator
+from typing import ClassVar
 
 from rich.text import Text
-from textual.containers import Vertical
+from textual.binding import BindingType
+from textual.containers import Horizontal, Vertical
 from textual.widget import Widget
-from textual.widgets import RichLog
+from textual.widgets import Input, Label, RichLog
+
+from pytest_tui_runner.logging import get_logger_config, logger
+from pytest_tui_runner.utils.scrollback import Scrollback, TerminalLine
+
+# How long the written lines are gathered before they are written to the log, in seconds
+FLUSH_INTERVAL = 1 / 60
+
+# Maximum number of lines written to the log at once, so one frame does not block the TUI
+MAX_FLUSH_LINES = 100
+
+# Number of gathered lines at which the writers wait for the log to catch up
+MAX_PENDING_LINES = 1000
+
+# Number of lines kept in the log, if not set by 'terminal_lines' in the log config
+DEFAULT_TERMINAL_LINES = 10_000
+
+# Number of lines read from the spilled output when the log is scrolled past its edge
+PAGE_LINES = 300
+
+# Style of the occurrences of the searched text
+MATCH_STYLE = "black on yellow"
 
 
 class TerminalView(Vertical):
-    """A page for displaying terminal output using RichLog in a vertical container."""
+    """A page for displaying terminal output using RichLog in a vertical container.
+
+    The lines are not written to the log one by one. They are gathered and written
+    together once per frame, so the log measures, renders and scrolls once per frame
+    instead of once per line, and at most 'MAX_FLUSH_LINES' lines at a time.
+    A writer producing lines faster than the log renders them awaits 'drain',
+    which slows it down instead of the TUI.
+
+    Every line is also spilled to the file of its run (see 'Scrollback'). The log keeps
+    only the last 'terminal_lines' lines. When it has more, it starts again from the last
+    page. Scrolling past the top of the log replaces it with the previous page read
+    from the files, and scrolling past the bottom with the next one, until the log
+    reaches the end of the output and follows it again.
+
+    Ctrl+F opens the search of the whole output, which uses the index of the scrollback,
+    so it does not read the output that cannot contain the searched text. The log shows
+    the page around the found line, Enter or F3 finds the next one, Shift+F3 the previous
+    one and Escape closes the search and follows the output again.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        ("ctrl+f", "search", "Search"),
+        ("f3", "search_next", "Next match"),
+        ("shift+f3", "search_previous", "Previous match"),
+        ("escape", "close_search", "Close search"),
+    ]
+
+    def __init__(self) -> None:
+        """Initialize the view with no gathered lines."""
+        super().__init__()
+        self._log: RichLog = RichLog(id="pytest_log", highlight=True, wrap=True)
+        self._pending: deque[TerminalLine] = deque()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self.scrollback = Scrollback()
+        self.terminal_lines: int = max(
+            int(get_logger_config().get("terminal_lines", DEFAULT_TERMINAL_LINES)),
+            2 * PAGE_LINES,
+        )
+        # Lines of the scrollback shown in the log, which follows the new lines if live
+        self._start: int = 0
+        self._end: int = 0
+        self._live: bool = True
+        self._search: Input = Input(placeholder="Search the output", id="terminal_search")
+        self._search_status: Label = Label("", id="search_status")
+        self._search_bar = Horizontal(self._search, self._search_status, id="search_bar")
+        # Line of the scrollback with the shown match and the highlighted text
+        self._match: int | None = None
+        self._highlight: re.Pattern[str] | None = None
 
     def compose(self) -> Iterator[Widget]:
         """Compose the widgets for the tests view, including the scrollable test widgets and control buttons.
@@ -18,23 +91,211 @@ class TerminalView(Vertical):
             The scrollable container of test widgets and the horizontal container of control buttons.
 
         """
-        yield RichLog(id="pytest_log", highlight=True, wrap=True)
+        yield self._log
+        yield self._search_bar
+
+    def on_mount(self) -> None:
+        """Page through the spilled output when the log is scrolled to its edge."""
+        self.watch(self._log, "scroll_y", self._on_log_scroll, init=False)
+
+    def on_unmount(self) -> None:
+        """Close the files with the spilled output."""
+        self.scrollback.close()
+
+    def start_run(self) -> None:
+        """Spill the next lines to the file of a new run."""
+        while self._pending:
+            self.flush()
+        self.scrollback.start_run()
 
     def write_line(self, line: str, style: str | None = None) -> None:
-        """Write a line to the RichLog widget.
+        """Write a line to the RichLog widget within the next frame.
 
         Parameters
         ----------
         line : str
             The line of text to write to the terminal log.
+        style : str | None, optional
+            Style of the line, the basic highlighting is used if not given.
 
         """
-        log: RichLog = self.query_one("#pytest_log", RichLog)
-
-        # I want to be able to enter my own style, but if I don't enter any,
-        # I want to leave the basic styling (even entering an empty style would cancel it)
-        if style:
-            line_with_style = Text(line, style=style)
-            log.write(line_with_style)
-        else:
-            log.write(line)
+        self._pending.append((line, style))
+        if self._flush_handle is None:
+            self._schedule_flush()
+
+    async def drain(self) -> None:
+        """Wait for the log to catch up, if too many lines are waiting to be written."""
+        while len(self._pending) >= MAX_PENDING_LINES:
+            self.flush()
+            await asyncio.sleep(FLUSH_INTERVAL)
+
+    def flush(self) -> None:
+        """Write the gathered lines to the scrollback and to the RichLog widget at once."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        count: int = min(len(self._pending), MAX_FLUSH_LINES)
+        lines: list[TerminalLine] = [self._pending.popleft() for _ in range(count)]
+        self.scrollback.append(lines)
+
+        # While an older page is shown, the new lines are only spilled
+        if self._live:
+            total: int = len(self.scrollback)
+            if total - self._start > self.terminal_lines:
+                self._show(total - PAGE_LINES, total)
+            else:
+                self._log.write(self._to_text(lines))
+                self._end = total
+
+        # The rest is written in the next frame
+        if self._pending:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Write the gathered lines in the next frame."""
+        self._flush_handle = asyncio.get_running_loop().call_later(FLUSH_INTERVAL, self.flush)
+
+    def _to_text(self, lines: list[TerminalLine]) -> Text:
+        """Join lines into one text for the log, with the searched text highlighted."""
+        texts: list[Text] = []
+        for line, style in lines:
+            # I want to be able to enter my own style, but if I don't enter any,
+            # I want to leave the basic styling (even entering an empty style would cancel it)
+            if style:
+                texts.append(Text(line, style=style))
+            else:
+                texts.append(self._log.highlighter(Text(line)))
+        text: Text = Text("\n").join(texts)
+        if self._highlight is not None:
+            text.highlight_regex(self._highlight, MATCH_STYLE)
+        return text
+
+    def _show(self, start: int, end: int, middle: int | None = None) -> int:
+        """Replace the content of the log with lines of the scrollback.
+
+        Parameters
+        ----------
+        start : int
+            First line to show.
+        end : int
+            Line after the last line to show, the log is live if it is the end of the output.
+        middle : int | None, optional
+            Line up to which the rows of the log are counted, the start if not given.
+
+        Returns
+        -------
+        int
+            Number of rows of the log before the middle line.
+
+        """
+        self._start, self._end = start, end
+        self._live = end == len(self.scrollback)
+        self._log.clear()
+
+        middle = start if middle is None else middle
+        rows: int = 0
+        for part_start, part_end in ((start, middle), (middle, end)):
+            if part_start < part_end:
+                lines: list[TerminalLine] = self.scrollback.read(part_start, part_end)
+                self._log.write(self._to_text(lines), scroll_end=self._live and middle == start)
+            if part_end == middle:
+                rows = len(self._log.lines)
+        return rows
+
+    def _on_log_scroll(self, old: float, new: float) -> None:
+        """Show the previous or the next page when the log is scrolled past its edge."""
+        if new < old and new == 0 and self._start > 0:
+            start: int = max(self._start - PAGE_LINES, 0)
+            end: int = min(self._end, start + 2 * PAGE_LINES)
+            logger.debug(f"Showing terminal lines {start} to {end} from the scrollback")
+            rows: int = self._show(start, end, middle=self._start)
+            self.call_after_refresh(self._log.scroll_to, y=rows, animate=False)
+        elif new > old and not self._live and new >= self._log.max_scroll_y:
+            end = min(self._end + PAGE_LINES, len(self.scrollback))
+            start = max(end - 2 * PAGE_LINES, 0)
+            logger.debug(f"Showing terminal lines {start} to {end} from the scrollback")
+            rows = self._show(start, end, middle=self._end)
+            y: int = max(rows - self._log.scrollable_content_region.height, 0)
+            self.call_after_refresh(self._log.scroll_to, y=y, animate=False)
+
+    def action_search(self) -> None:
+        """Show the search bar."""
+        self._search_bar.display = True
+        self._search.focus()
+
+    def action_close_search(self) -> None:
+        """Hide the search bar and follow the output again."""
+        if not self._search_bar.display:
+            return
+
+        self._search_bar.display = False
+        self._match = None
+        self._highlight = None
+        total: int = len(self.scrollback)
+        self._show(max(total - PAGE_LINES, 0), total)
+        self._log.focus()
+
+    def action_search_next(self) -> None:
+        """Show the next line containing the searched text."""
+        start: int = self._start if self._match is None else self._match + 1
+        self._find(start)
+
+    def action_search_previous(self) -> None:
+        """Show the previous line containing the searched text."""
+        start: int = self._end - 1 if self._match is None else self._match - 1
+        self._find(start, backward=True)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Find the searched text as it is typed, from the shown match on."""
+        if event.input is not self._search:
+            return
+
+        start: int = self._start if self._match is None else self._match
+        self._find(start)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Show the next match when Enter is pressed in the search bar."""
+        if event.input is self._search:
+            self.action_search_next()
+
+    def _find(self, start: int, *, backward: bool = False) -> None:
+        """Show the line containing the searched text, from the start line around the output."""
+        query: str = self._search.value
+        if not query:
+            self._search_status.update("")
+            return
+
+        # The waiting lines are searched too
+        while self._pending:
+            self.flush()
+
+        total: int = len(self.scrollback)
+        line: int | None = None
+        if 0 <= start < total:
+            line = self.scrollback.search(query, start, backward=backward)
+        if line is None:
+            line = self.scrollback.search(query, total - 1 if backward else 0, backward=backward)
+        logger.debug(f"Search of '{query}' from line {start} found line {line}")
+
+        self._highlight = re.compile(re.escape(query), re.IGNORECASE)
+        if line is None:
+            self._search_status.update("No match")
+            return
+
+        self._match = line
+        self._search_status.update(f"Line {line + 1} of {total}")
+        self._show_match(line)
+
+    def _show_match(self, line: int) -> None:
+        """Show the page around a line of the scrollback with the line in the middle."""
+        total: int = len(self.scrollback)
+        start: int = max(min(line - PAGE_LINES, total - 2 * PAGE_LINES), 0)
+        end: int = min(start + 2 * PAGE_LINES, total)
+        rows: int = self._show(start, end, middle=line)
+        # The log does not jump to the new lines while a match is shown
+        self._live = False
+        y: int = max(rows - self._log.scrollable_content_region.height // 2, 0)
+        self.call_after_refresh(self._log.scroll_to, y=y, animate=False)
@@ -1,16 +1,21 @@
+import os
 from collections.abc import Iterator
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from textual.binding import BindingType
 from textual.containers import Horizontal, ScrollableContainer, Vertical
 from textual.widget import Widget
-from textual.widgets import Button
+from textual.widgets import Button, Checkbox, Select
 
 from pytest_tui_runner.logging import logger
 from pytest_tui_runner.paths import Paths
 from pytest_tui_runner.ui.tui.handlers.button_handler import ButtonHandler
+from pytest_tui_runner.ui.tui.pages.output_view import OutputView
+from pytest_tui_runner.utils.pytest import warm_worker
 
 if TYPE_CHECKING:
     from pytest_tui_runner.ui.tui.pages.terminal_view import TerminalView
+    from pytest_tui_runner.utils.test_results import TestResult
     from pytest_tui_runner.utils.types.config import TestConfig
 
 from pytest_tui_runner.config import load_config
@@ -21,8 +26,11 @@ class TestsView(Vertical):
     """A page for displaying and managing tests widgets in the TUI.
 
     Handles loading configuration, managing widgets, and responding to button events.
+    The output captured in the test of the focused widget is shown by pressing Ctrl+O.
     """
 
+    BINDINGS: ClassVar[list[BindingType]] = [("ctrl+o", "show_output", "Show output")]
+
     def __init__(self) -> None:
         """Initialize the TestsView, loading configuration and setting up the widget manager."""
         super().__init__()
@@ -46,16 +54,32 @@ class TestsView(Vertical):
         # Thanks to this, we will be able to display the progress of the tests in the terminal
         terminal_view: TerminalView = self.app.terminal_view
 
+        # The warm worker imports everything for the tests while the user is picking them
+        self.warm_worker: warm_worker.WarmWorker | None = None
+        if self.app.use_warm_worker:
+            if warm_worker.is_supported():
+                self.warm_worker = warm_worker.WarmWorker(Paths.user_root())
+                self.warm_worker.start()
+            else:
+                logger.warning("Warm worker needs 'os.fork', tests run in new processes")
+
         # ButtonHandler handles all actions associated with pressing buttons
         logger.debug("Initialize ButtonHandler")
         self.button_handler = ButtonHandler(
-            self.widget_manager.widgets,
+            self.widget_manager.registry,
             self.buttons,
             terminal_view,
+            workers=self.app.test_workers,
+            warm_worker=self.warm_worker,
         )
 
         logger.debug("✅ Mounting test page finnished")
 
+    def on_unmount(self) -> None:
+        """Stop the warm worker together with the page."""
+        if self.warm_worker is not None:
+            self.warm_worker.close()
+
     def compose(self) -> Iterator[Widget]:
         """Compose the widgets for the tests view, including the scrollable test widgets and control buttons.
 
@@ -75,11 +99,41 @@ class TestsView(Vertical):
             Button("Exit", id="exit", classes="button"),
         ]
 
+        max_workers: int = max(os.cpu_count() or 1, self.app.test_workers)
+        workers_select: Select[int] = Select(
+            [(f"{n} worker{'s' if n > 1 else ''}", n) for n in range(1, max_workers + 1)],
+            value=self.app.test_workers,
+            allow_blank=False,
+            id="workers",
+        )
+
+        # Options of the run, they apply to the next press of 'Run tests'
+        run_options: list[Checkbox] = [
+            Checkbox("Failed first", id="failed_first", classes="run_option"),
+            Checkbox("Stop on failure", id="exitfirst", classes="run_option"),
+        ]
+
         # A container that contains all the additional buttons for controlling the test
-        yield Horizontal(*self.buttons, id="button_container")
+        yield Horizontal(*self.buttons, workers_select, *run_options, id="button_container")
 
         logger.debug("✅ Composing test page finnished")
 
+    def on_select_changed(self, event: Select.Changed) -> None:
+        """Set the number of parallel workers for the next test runs."""
+        if event.select.id == "workers" and isinstance(event.value, int):
+            logger.debug(f"Number of workers set to {event.value}")
+            self.button_handler.workers = event.value
+
+    def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
+        """Set the ordering and stopping options for the next test runs."""
+        match event.checkbox.id:
+            case "failed_first":
+                logger.debug(f"Failed-first ordering set to {event.value}")
+                self.button_handler.failed_first = event.value
+            case "exitfirst":
+                logger.debug(f"Stopping on the first failure set to {event.value}")
+                self.button_handler.exitfirst = event.value
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events and trigger corresponding actions.
 
@@ -95,3 +149,28 @@ class TestsView(Vertical):
             case "exit":
                 self.widget_manager.save_state()
                 self.app.exit()
+
+    def action_show_output(self) -> None:
+        """Show the output captured in the last run of the test of the focused widget."""
+        test_result: TestResult | None = None
+        widget: Widget | None = self.app.focused
+        # The focus may be inside the widget of the test, e.g. in the list of a Select
+        while widget is not None and test_result is None:
+            test_result = self.button_handler.result_of(widget)
+            widget = widget.parent if isinstance(widget.parent, Widget) else None
+
+        if test_result is None:
+            self.app.notify("The focused widget has no test result", severity="warning")
+            return
+        if test_result.output is None:
+            self.app.notify(f"No output was captured in {test_result.nodeid}")
+            return
+
+        try:
+            output: str = test_result.output.read()
+        except OSError as e:
+            logger.error(f"Output of {test_result.nodeid} could not be read: {e}")
+            self.app.notify("The output of the test could not be read", severity="error")
+            return
+
+        self.app.push_screen(OutputView(test_result, output))
@@ -0,0 +1,13 @@
+import socket
+
+
+def connect_channel(address: str) -> socket.socket:
+    """Connect to a channel server of the TUI by its address (see 'ChannelServer')."""
+    kind, _, target = address.partition(":")
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(target)
+        return sock
+
+    host, _, port = target.rpartition(":")
+    return socket.create_connection((host, int(port)))
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import os
+from types import TracebackType
+
+from typing_extensions import Self
+
+from pytest_tui_runner.logging import get_logger_config, logger
+from pytest_tui_runner.paths import Paths
+from pytest_tui_runner.utils.channel.server import ChannelServer
+
+
+class LogCollector:
+    """Channel through which the pytest processes send their logs to the TUI.
+
+    Every connected process sends one JSON line per formatted message (see 'LogSender').
+    The messages are written by the file handler of the TUI, which filters them by its
+    level, writes them from its own queue and rotates the file. The TUI is then the only
+    process writing the log file, however many workers run.
+
+    The address and the log configuration are put into the environment of the TUI,
+    so every pytest process it starts inherits them and never reads the log files.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the collector, it listens once entered."""
+        self._channel = ChannelServer(self._serve)
+
+    @property
+    def address(self) -> str:
+        """Address the pytest processes connect to."""
+        return self._channel.address
+
+    async def __aenter__(self) -> Self:
+        """Start receiving the logs."""
+        await self._channel.__aenter__()
+        os.environ[Paths.LOG_ENV_VAR] = self.address
+        os.environ[Paths.LOG_CONFIG_ENV_VAR] = json.dumps(get_logger_config(), default=str)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Receive the rest of the logs and stop."""
+        os.environ.pop(Paths.LOG_ENV_VAR, None)
+        os.environ.pop(Paths.LOG_CONFIG_ENV_VAR, None)
+        await self._channel.__aexit__(exc_type, exc, traceback)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Write every message of a pytest process through the handlers of the TUI."""
+        raw_logger = logger.opt(raw=True)
+        try:
+            async for line in reader:
+                message: dict = json.loads(line)
+                raw_logger.log(message["level"], message["text"])
+        except (ConnectionError, KeyError, ValueError) as e:
+            logger.warning(f"Log channel of a pytest process broke: {e}")
+        finally:
+            writer.close()
@@ -0,0 +1,60 @@
+import asyncio
+import json
+from collections.abc import Callable
+from types import TracebackType
+
+from typing_extensions import Self
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.channel.server import ChannelServer
+from pytest_tui_runner.utils.test_results import TestResult, result_from_record
+
+
+class ResultStream:
+    """Channel through which the pytest processes send the result of every finished test.
+
+    Every connected process first sends its rootdir and output spool, then one JSON record
+    per test (see 'ResultRecorder' in the plugin). The results are passed to the callback
+    as they arrive.
+    """
+
+    def __init__(self, on_result: Callable[[TestResult], None]) -> None:
+        """Initialize the stream with a callback called for every received result."""
+        self.on_result: Callable[[TestResult], None] = on_result
+        self.rootdir: str = ""
+        self._channel = ChannelServer(self._serve)
+
+    @property
+    def address(self) -> str:
+        """Address the pytest processes connect to."""
+        return self._channel.address
+
+    async def __aenter__(self) -> Self:
+        """Start receiving the results."""
+        await self._channel.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Receive the rest of the results and stop."""
+        await self._channel.__aexit__(exc_type, exc, traceback)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Pass every record of a pytest process to the callback."""
+        spool: str | None = None
+        try:
+            async for line in reader:
+                record: dict = json.loads(line)
+                if "root" in record:
+                    self.rootdir = record["root"]
+                    spool = record.get("output")
+                else:
+                    self.on_result(result_from_record(record, spool))
+        except (ConnectionError, json.JSONDecodeError) as e:
+            logger.warning(f"Result channel of a pytest process broke: {e}")
+        finally:
+            writer.close()
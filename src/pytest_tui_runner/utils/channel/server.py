@@ -0,0 +1,86 @@
+import asyncio
+import shutil
+import socket
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from types import TracebackType
+
+from typing_extensions import Self
+
+from pytest_tui_runner.logging import logger
+
+ConnectionHandler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+# How long closing the server waits for the clients to send the rest of their messages
+CLOSE_TIMEOUT = 5.0
+
+
+class ChannelServer:
+    """Local server through which the pytest processes talk to the TUI.
+
+    A Unix socket in a private temporary directory is used where available,
+    otherwise a TCP socket on the loopback interface. Clients connect to it
+    with 'connect_channel' using the 'address' of the server.
+
+    Closing the server first waits for the connected clients to disconnect, so
+    the messages of a process that has just exited are not lost.
+
+    Usage::
+
+        async with ChannelServer(handler) as server:
+            ...  # pass server.address to the pytest processes
+    """
+
+    def __init__(self, handler: ConnectionHandler) -> None:
+        """Initialize the server with a handler called for every connection."""
+        self.handler: ConnectionHandler = handler
+        self.address: str = ""
+        self._server: asyncio.AbstractServer | None = None
+        self._directory: Path | None = None
+        self._connections: set[asyncio.Task] = set()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Call the handler, keeping track of the open connections."""
+        task: asyncio.Task | None = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        try:
+            await self.handler(reader, writer)
+        finally:
+            self._connections.discard(task)
+
+    async def __aenter__(self) -> Self:
+        """Start listening."""
+        if hasattr(socket, "AF_UNIX"):
+            # The directory is only accessible to the current user
+            self._directory = Path(tempfile.mkdtemp(prefix="pytest-tui-runner-"))
+            path = self._directory / "channel.sock"
+            self._server = await asyncio.start_unix_server(self._handle, path=str(path))
+            self.address = f"unix:{path}"
+        else:
+            self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+            port: int = self._server.sockets[0].getsockname()[1]
+            self.address = f"tcp:127.0.0.1:{port}"
+
+        logger.debug(f"Channel server listening on '{self.address}'")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Wait for the clients, then stop listening and remove the socket."""
+        if self._connections:
+            _, pending = await asyncio.wait(self._connections, timeout=CLOSE_TIMEOUT)
+            for task in pending:
+                logger.warning(f"Client of '{self.address}' did not disconnect in time")
+                task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+        logger.debug(f"Channel server on '{self.address}' closed")
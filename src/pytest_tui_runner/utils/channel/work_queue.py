@@ -0,0 +1,54 @@
+import asyncio
+import json
+from collections import deque
+from types import TracebackType
+
+from typing_extensions import Self
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.channel.server import ChannelServer
+
+
+class WorkQueue:
+    """Queue of work units shared by the parallel pytest workers.
+
+    A unit is the absolute node ID of a test function, as resolved from the collection
+    cache (parametrized variants of one function always run in the same worker).
+    Workers pull units one by one, so faster workers simply take more of them.
+    """
+
+    def __init__(self, units: list[str]) -> None:
+        """Initialize the queue with the work units in the order they should start."""
+        self.units: deque[str] = deque(units)
+        self._channel = ChannelServer(self._serve)
+
+    @property
+    def address(self) -> str:
+        """Address the workers connect to."""
+        return self._channel.address
+
+    async def __aenter__(self) -> Self:
+        """Start serving the units to the workers."""
+        await self._channel.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving the units."""
+        await self._channel.__aexit__(exc_type, exc, traceback)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer every request line of a worker with the next unit (null when empty)."""
+        try:
+            while await reader.readline():
+                unit: str | None = self.units.popleft() if self.units else None
+                writer.write(json.dumps({"unit": unit}).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError as e:
+            logger.warning(f"Worker disconnected from the work queue: {e}")
+        finally:
+            writer.close()
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from pytest_tui_runner.utils.history import NodeHistory
+from pytest_tui_runner.utils.test_results import TestResult
+
+# Weight of the newest run in the stored duration. Averaging with the older runs
+# keeps one slow run on a busy machine from reordering the whole suite
+SMOOTHING = 0.5
+
+
+@dataclass
+class DurationHistory(NodeHistory[float]):
+    """Durations of the tests from the previous runs, used to start the longest tests first.
+
+    The values are the smoothed durations in seconds (setup, call and teardown).
+    """
+
+    VALUES_KEY: ClassVar[str] = "durations"
+    NAME: ClassVar[str] = "duration history"
+
+    def updated_value(self, test_result: TestResult, previous: float | None) -> float | None:
+        """Get the smoothed duration of the test after it ran again."""
+        # Skipped tests did not run, so their duration says nothing about the next run
+        if test_result.outcome == "skipped":
+            return None
+
+        if previous is None:
+            return round(test_result.duration, 4)
+        return round(previous + SMOOTHING * (test_result.duration - previous), 4)
+
+    def unit_durations(self) -> dict[str, float]:
+        """Get the total duration of every test function by its absolute base node ID.
+
+        These are the units of work of a parallel run, so all parametrized variants
+        of a function are summed.
+        """
+        totals: dict[str, float] = {}
+        for node_id, duration in self.values.items():
+            unit: str = self.unit(node_id)
+            totals[unit] = totals.get(unit, 0.0) + duration
+        return totals
+
+    def longest_first(self, units: list[str]) -> list[str]:
+        """Order the units of work so the longest ones start first.
+
+        Units without history are expected to take the average time of the known ones.
+        The sort is stable, so units with equal durations keep the collection order.
+        """
+        totals: dict[str, float] = self.unit_durations()
+        default: float = sum(totals.values()) / len(totals) if totals else 0.0
+        return sorted(units, key=lambda unit: totals.get(unit, default), reverse=True)
@@ -0,0 +1,94 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar, Generic, TypeVar
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.test_results import TestResult
+
+HISTORY_VERSION = 1
+
+T = TypeVar("T")
+# The histories are read by the pytest plugin, which supports Python 3.10 without typing.Self
+H = TypeVar("H", bound="NodeHistory")
+
+
+@dataclass
+class NodeHistory(ABC, Generic[T]):
+    """One value of every test from the previous runs, stored as JSON by node ID.
+
+    The node IDs are relative to the pytest rootdir, so the history is kept for one rootdir.
+    Subclasses set the key of the values in the file and how a result updates its value.
+
+    Attributes
+    ----------
+    rootdir : str
+        The pytest rootdir, to which the node IDs are relative.
+    values : dict[str, T]
+        Value of the test by node ID.
+
+    """
+
+    # Key of the values in the file, and what the history is called in the messages
+    VALUES_KEY: ClassVar[str] = "values"
+    NAME: ClassVar[str] = "history"
+
+    rootdir: str = ""
+    values: dict[str, T] = field(default_factory=dict)
+
+    def update(self, rootdir: str, test_results: list[TestResult]) -> None:
+        """Add the results of the tests that ran, the others keep their value."""
+        if rootdir != self.rootdir:
+            # Node IDs relative to another rootdir would never match again
+            self.rootdir = rootdir
+            self.values.clear()
+
+        for test_result in test_results:
+            if not test_result.nodeid:
+                continue
+
+            value: T | None = self.updated_value(test_result, self.values.get(test_result.nodeid))
+            if value is not None:
+                self.values[test_result.nodeid] = value
+
+    @abstractmethod
+    def updated_value(self, test_result: TestResult, previous: T | None) -> T | None:
+        """Get the value of the test after its result, None to keep the previous one."""
+
+    def unit(self, node_id: str) -> str:
+        """Get the unit of work of a parallel run, the absolute base node ID of a test."""
+        return str(Path(self.rootdir) / node_id.split("[", 1)[0])
+
+    def write(self, path: Path) -> None:
+        """Write the history to the given file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": HISTORY_VERSION, "rootdir": self.rootdir, self.VALUES_KEY: self.values}
+        with Path.open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def read(cls: type[H], path: Path) -> H:  # noqa: PYI019
+        """Read the history from the given file, or start an empty one."""
+        if not path.is_file():
+            return cls()
+
+        try:
+            with Path.open(path, encoding="utf-8") as f:
+                data: dict = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to read the {cls.NAME} '{path}': {e}")
+            return cls()
+
+        if data.get("version") != HISTORY_VERSION:
+            return cls()
+
+        return cls(rootdir=data.get("rootdir", ""), values=data.get(cls.VALUES_KEY, {}))
+
+    @classmethod
+    def record(cls, path: Path, rootdir: str, test_results: list[TestResult]) -> None:
+        """Update the stored history with the results of the last run."""
+        history: NodeHistory = cls.read(path)
+        history.update(rootdir, test_results)
+        history.write(path)
+        logger.debug(f"{cls.NAME.capitalize()} updated, {len(history.values)} tests known")
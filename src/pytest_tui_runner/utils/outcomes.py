@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from pytest_tui_runner.utils.history import NodeHistory
+from pytest_tui_runner.utils.test_results import TestResult
+
+FAILING_OUTCOMES = {"failed", "error"}
+
+# Rank of the tests in the failed-first order, lower runs first
+RANK_FAILED = 0
+RANK_NEW = 1
+RANK_OTHER = 2
+
+
+@dataclass
+class OutcomeHistory(NodeHistory[str]):
+    """Last outcome of every test that ever ran, used to run the failed and new tests first."""
+
+    VALUES_KEY: ClassVar[str] = "outcomes"
+    NAME: ClassVar[str] = "outcome history"
+
+    def updated_value(self, test_result: TestResult, previous: str | None) -> str:  # noqa: ARG002
+        """Get the outcome of the last run of the test."""
+        return test_result.outcome
+
+    def rank(self, node_id: str) -> int:
+        """Get the rank of the test in the failed-first order: failed, new, then the rest."""
+        outcome: str | None = self.values.get(node_id)
+        if outcome is None:
+            return RANK_NEW
+        if outcome in FAILING_OUTCOMES:
+            return RANK_FAILED
+        return RANK_OTHER
+
+    def failed_units_first(self, units: list[str]) -> list[str]:
+        """Order the absolute base node IDs of a parallel run in the failed-first order.
+
+        A unit ranks as its best-ranked variant, and as new if none of them ran yet.
+        """
+        ranks: dict[str, int] = {}
+        for node_id in self.values:
+            unit: str = self.unit(node_id)
+            ranks[unit] = min(ranks.get(unit, RANK_OTHER), self.rank(node_id))
+        return sorted(units, key=lambda unit: ranks.get(unit, RANK_NEW))
@@ -1,24 +1,35 @@
 import sys
-
-from textual.widget import Widget
-from textual.widgets import Checkbox
+from pathlib import Path
 
 from pytest_tui_runner.logging import logger
 from pytest_tui_runner.paths import Paths
-from pytest_tui_runner.utils.pytest.encoding import encode_variants
-from pytest_tui_runner.utils.types.widgets import TestArguments, WidgetsDict
-from pytest_tui_runner.utils.widgets.marking import mark_widget_running
+from pytest_tui_runner.utils.pytest.manifest import MANIFEST_OPTION, REPORT_OPTION
+
+
+def pytest_command() -> list[str]:
+    """Get the command that starts pytest with the current interpreter."""
+    return [sys.executable, "-m", "pytest"]
 
 
-def build_pytest_arguments(widgets: dict) -> list[str]:
-    """Build a list of arguments for running pytest based on provided widgetsand an optional pytest.ini path.
+def build_pytest_arguments(
+    manifest_path: Path,
+    collection_args: list[str],
+    report_path: Path | None = None,
+    *,
+    exitfirst: bool = False,
+) -> list[str]:
+    """Build a list of arguments for running pytest with the tests selected by the user.
 
     Parameters
     ----------
-    widgets : dict
-        Dictionary containing widget objects organized by categories and subcategories.
-    pytest_init_path : str, optional
-        Path to a custom pytest.ini file (default is "")
+    manifest_path : Path
+        Path to the selection manifest written by the TUI.
+    collection_args : list[str]
+        Node IDs or files to collect, or an empty list to collect all tests.
+    report_path : Path, optional
+        Path where the results are saved (default is 'Paths.pytest_report()').
+    exitfirst : bool, optional
+        Stop the run at the first failed test.
 
     Returns
     -------
@@ -27,77 +38,41 @@ def build_pytest_arguments(widgets: dict) -> list[str]:
 
     """
     # Default arguments to run pytest
-    args: list[str] = [sys.executable, "-m", "pytest"]
+    args: list[str] = pytest_command()
 
     # Add flag to ignore unknows pytest markings in the user project
     args += ["-W", "ignore::pytest.PytestUnknownMarkWarning"]
 
     # Additional arguments for pytest
-    args += ["-s"]  # -s for capturing output
+    # The output is shown live and also captured, for the output of every single test.
+    # It is not repeated in the failures, only the captured logs, which are not shown live
+    args += ["--capture=tee-sys", "--show-capture=log"]
     args += ["-v"]  # -v for verbose output
+    if exitfirst:
+        args += ["-x"]  # -x for stopping at the first failure
 
-    # Additional arguments for saving the pytest result to a json file
-    args += [
-        "--json-report",  # Plugin activation
-        f"--json-report-file={Paths.pytest_report()}",  # Path where the results are saved
-    ]
+    # The plugin saves the results of the tests to this file
+    args += [f"{REPORT_OPTION}={report_path or Paths.pytest_report()}"]
 
-    logger.debug(f"Arguments to run pytest = {args}")
+    # The selected tests themselves are passed in a manifest file
+    args += [f"{MANIFEST_OPTION}={manifest_path}"]
 
-    # Add widget-derived arguments
-    pytest_arguments = extract_widget_arguments(widgets)
-    logger.debug(f"Pytest arguments = {pytest_arguments}")
-    args.extend(pytest_arguments)
+    # Narrow the collection to the selected tests, if they are known
+    args += collection_args
 
     logger.info(f"Command to start the tests = {args}")
     return args
 
 
-def extract_widget_arguments(widgets: WidgetsDict) -> list[str]:
-    """Extract pytest CLI arguments from widget states."""
-    args: list[str] = []
-    for subcats in widgets.values():
-        for tests in subcats.values():
-            for test_name, widget_list in tests.items():
-                # Check if widget_list contains arguments for the test
-                if isinstance(widget_list[0], list):
-                    arg: str | None = widget_to_argument(test_name, widget_list)
-                    if arg:
-                        logger.debug(f"Converted special test '{test_name}' to '{arg}'")
-                        args.append(arg)
-                    else:
-                        logger.debug(f"Test '{test_name}' has no set arguments")
-                else:
-                    for widget in widget_list:
-                        arg: str | None = widget_to_argument(test_name, widget)
-                        if arg:
-                            logger.debug(f"Converted basic test '{test_name}' to '{arg}'")
-                            args.append(arg)
-
-                            logger.debug(f"Marking widget as running: {widget}")
-                            mark_widget_running(widget)
-                        else:
-                            logger.debug(f"Test '{test_name}' not selected")
-    return args
-
-
-def widget_to_argument(test_name: str, widgets: Widget | list[TestArguments]) -> str | None:
-    """Convert a widget into a pytest CLI argument, if applicable."""
-    # Basic Checkbox type test
-    if isinstance(widgets, Checkbox) and widgets.value:
-        return format_test_flag(str(widgets.label))
-
-    if isinstance(widgets, list) and widgets:
-        logger.debug("▶️ Encoding special test...")
-        variant_strings: str = encode_variants(test_name, widgets)
-        if variant_strings is not None:
-            logger.debug("✅ Special test encoded")
-            return f"{format_test_flag(test_name)}=" + variant_strings
-
-    return None
+def build_collect_arguments(manifest_path: Path) -> list[str]:
+    """Build a list of arguments for only collecting the tests selected by the user.
 
+    A complete collection also refreshes the collection cache.
+    """
+    args: list[str] = pytest_command()
+    args += ["-W", "ignore::pytest.PytestUnknownMarkWarning"]
+    args += ["--collect-only", "-qq"]
+    args += [f"{MANIFEST_OPTION}={manifest_path}"]
 
-def format_test_flag(test_name: str) -> str:
-    """Format test name into a pytest CLI flag."""
-    # Example: "My Test" → "--run-my-test"
-    return f"--run-{test_name.lower().replace(' ', '-')}"
+    logger.info(f"Command to collect the tests = {args}")
+    return args
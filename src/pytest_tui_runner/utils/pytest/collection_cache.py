@@ -0,0 +1,195 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.pytest.manifest import SelectionManifest
+from pytest_tui_runner.utils.pytest.selection import item_markers
+
+CACHE_VERSION = 2
+
+# Above this total length, the node IDs are replaced by their files,
+# so the command line stays far below the limits of every platform
+MAX_NODE_IDS_LENGTH = 100_000
+
+
+def markers_key(markers: list[str] | frozenset[str]) -> str:
+    """Turn a set of markers into a key that can be stored in JSON."""
+    return ",".join(sorted(set(markers)))
+
+
+def base_node_id(item: pytest.Item) -> str:
+    """Get the node ID of the item without the parametrization suffix."""
+    return item.nodeid.split("[", 1)[0]
+
+
+@dataclass
+class CollectionCache:
+    """Node IDs of the collected tests, indexed like the config identifies the tests.
+
+    It is written by the plugin after a full collection and lets the TUI pass exact
+    node IDs to pytest, so only the modules with the selected tests are imported.
+    The cache is stale as soon as a collected file, a conftest.py or one of
+    the directories above them changes.
+
+    Attributes
+    ----------
+    rootdir : str
+        The pytest rootdir, to which the node IDs are relative.
+    files : dict[str, list[int]]
+        Modification time and size of the files the collection depends on.
+    dirs : dict[str, int]
+        Modification time of the directories containing them, to notice new files.
+    by_test_name : dict[str, list[str]]
+        Node IDs by test function name.
+    by_markers : dict[str, list[str]]
+        Node IDs by marker set (see 'markers_key').
+    positions : dict[str, int]
+        Position of every node ID in the collection, pytest runs the node IDs it is given
+        in their order, so they are passed in the order of the collection.
+
+    """
+
+    rootdir: str
+    files: dict[str, list[int]] = field(default_factory=dict)
+    dirs: dict[str, int] = field(default_factory=dict)
+    by_test_name: dict[str, list[str]] = field(default_factory=dict)
+    by_markers: dict[str, list[str]] = field(default_factory=dict)
+    positions: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_items(cls, rootdir: Path, items: list[pytest.Item]) -> "CollectionCache":
+        """Index all collected items before they are filtered."""
+        cache = cls(rootdir=str(rootdir))
+
+        # Dicts are used as ordered sets, so parametrized items are stored only once
+        by_test_name: dict[str, dict[str, None]] = {}
+        by_markers: dict[str, dict[str, None]] = {}
+        paths: set[Path] = set()
+        for item in items:
+            node_id = base_node_id(item)
+            by_test_name.setdefault(item.name.split("[")[0], {})[node_id] = None
+            by_markers.setdefault(markers_key(item_markers(item)), {})[node_id] = None
+            cache.positions.setdefault(node_id, len(cache.positions))
+            paths.add(item.path)
+
+        cache.by_test_name = {name: list(ids) for name, ids in by_test_name.items()}
+        cache.by_markers = {key: list(ids) for key, ids in by_markers.items()}
+
+        dirs: set[Path] = set()
+        for path in paths:
+            for parent in path.parents:
+                dirs.add(parent)
+                if parent == rootdir or rootdir not in parent.parents:
+                    break
+
+        for directory in dirs:
+            cache.dirs[str(directory)] = directory.stat().st_mtime_ns
+            conftest = directory / "conftest.py"
+            if conftest.is_file():
+                paths.add(conftest)
+
+        for path in paths:
+            stat = path.stat()
+            cache.files[str(path)] = [stat.st_mtime_ns, stat.st_size]
+
+        return cache
+
+    def is_fresh(self) -> bool:
+        """Check that no file or directory the collection depends on has changed."""
+        try:
+            for file, (mtime, size) in self.files.items():
+                stat = Path(file).stat()
+                if stat.st_mtime_ns != mtime or stat.st_size != size:
+                    logger.debug(f"Collection cache is stale, '{file}' has changed")
+                    return False
+            for directory, mtime in self.dirs.items():
+                if Path(directory).stat().st_mtime_ns != mtime:
+                    logger.debug(f"Collection cache is stale, '{directory}' has changed")
+                    return False
+        except OSError as e:
+            logger.debug(f"Collection cache is stale: {e}")
+            return False
+        return True
+
+    def resolve(self, manifest: SelectionManifest) -> list[str]:
+        """Get the absolute node IDs of the tests selected in the manifest.
+
+        They are in the order of the collection, not of the config, so the tests of one module
+        still run together and share their module-scoped fixtures.
+        """
+        node_ids: dict[str, None] = {}
+        for test_def in manifest.tests:
+            if "markers" in test_def:
+                ids = self.by_markers.get(markers_key(test_def["markers"]), [])
+            else:
+                ids = self.by_test_name.get(test_def.get("test_name"), [])
+            node_ids.update(dict.fromkeys(ids))
+
+        ordered: list[str] = sorted(node_ids, key=lambda node_id: self.positions.get(node_id, 0))
+        return [str(Path(self.rootdir) / node_id) for node_id in ordered]
+
+    def write(self, path: Path) -> None:
+        """Write the cache to the given file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CACHE_VERSION,
+            "rootdir": self.rootdir,
+            "files": self.files,
+            "dirs": self.dirs,
+            "by_test_name": self.by_test_name,
+            "by_markers": self.by_markers,
+            "positions": self.positions,
+        }
+        with Path.open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def read(cls, path: Path) -> "CollectionCache | None":
+        """Read the cache from the given file, if there is a usable one."""
+        if not path.is_file():
+            return None
+
+        try:
+            with Path.open(path, encoding="utf-8") as f:
+                data: dict = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to read the collection cache '{path}': {e}")
+            return None
+
+        if data.get("version") != CACHE_VERSION:
+            return None
+
+        return cls(
+            rootdir=data["rootdir"],
+            files=data.get("files", {}),
+            dirs=data.get("dirs", {}),
+            by_test_name=data.get("by_test_name", {}),
+            by_markers=data.get("by_markers", {}),
+            positions=data.get("positions", {}),
+        )
+
+
+def cached_node_ids(manifest: SelectionManifest, cache_path: Path) -> list[str]:
+    """Get the absolute node IDs of the selected tests from a fresh collection cache.
+
+    An empty list means the cache cannot be used and pytest has to collect everything.
+    """
+    cache = CollectionCache.read(cache_path)
+    if cache is None or not cache.is_fresh():
+        logger.debug("No fresh collection cache, all tests will be collected")
+        return []
+
+    node_ids: list[str] = cache.resolve(manifest)
+    logger.debug(f"Collection narrowed by the cache to {len(node_ids)} node IDs")
+    return node_ids
+
+
+def collection_args(node_ids: list[str]) -> list[str]:
+    """Turn node IDs into pytest arguments, using their files if the IDs are too long."""
+    if sum(len(node_id) for node_id in node_ids) > MAX_NODE_IDS_LENGTH:
+        logger.debug("Too many node IDs for the command line, passing their files instead")
+        return list(dict.fromkeys(node_id.split("::", 1)[0] for node_id in node_ids))
+    return node_ids
@@ -1,85 +1,47 @@
-from urllib.parse import quote, unquote
+import hashlib
 
-from textual.widgets import Select
+from pytest_tui_runner.utils.types.config import ArgumentValue, Variant, VariantTable
 
-from pytest_tui_runner.logging import logger
-from pytest_tui_runner.utils.types.widgets import TestArguments
-from pytest_tui_runner.utils.widgets.marking import mark_widget_list_running
+# Separates the argument values in the hashed input, it is not typed in a widget
+VALUE_SEPARATOR = "\x1f"
 
-VARIANT_SEP = ";"
-PAIR_SEP = ","
-KV_SEP = ":"
 
-
-def encode_variants(test_name: str, variants: list[TestArguments]) -> str | None:
+def variant_id(values: list[ArgumentValue]) -> str:
     """
-    Encode list of variant dicts into a single string.
+    Get the short, stable id of a variant, used as its pytest parametrization id.
+
+    The id depends only on the argument values, so the TUI can compute it for a widget
+    row and find the result of the row without parsing the node ID. It contains
+    no dash, so it stays recognizable when pytest joins it with other parametrizations.
 
     Example:
-      [{'action': 'Delete', 'image': '123'}, {'action': 'Copy', 'image': '456'}]
-    → "action:Delete,image:123;action:Copy,image:456"
+      ['Delete', '123'] → '02402e2d'
     """
-    encoded_variants: list[str] = []
-    had_any_value = False
-
-    for i, widget_list in enumerate(variants):
-        logger.debug(f"Processing '{i}' variant of the arguments")
-        parts: list[str] = []
-        for widget in widget_list:
-            if hasattr(widget, "name") and hasattr(widget, "value"):
-                if widget.value in (None, "", Select.BLANK):
-                    logger.debug(f"Missing value for widget = {widget}")
-                    continue
-                had_any_value = True
-                name: str = quote(str(widget.name), safe="")
-                value: str = quote(str(widget.value), safe="")
-                parts.append(f"{name}{KV_SEP}{value}")
-
-        logger.debug(f"Processed variant of the arguments = {parts}")
-        if parts and len(parts) == len(widget_list):
-            encoded_variants.append(PAIR_SEP.join(parts))
-            logger.debug("Marking this variant as running")
-            mark_widget_list_running(widget_list)
-        else:
-            logger.debug("WARNING: This variant will be skipped because some argument is missing")
-
-    if not had_any_value:
-        logger.debug(f"Test '{test_name}' has no arguments set, so it will be skipped")
-        return None
+    return hashlib.blake2s(VALUE_SEPARATOR.join(values).encode(), digest_size=4).hexdigest()
 
-    # This part checks if the user has not entered duplicate arguments for the test,
-    # which would cause the pytest result to be incorrectly processed for coloring the widgets.
-    # But now there is no way to tell the user what is wrong (pop-up window),
-    # so this is commented out.
 
-    # if has_duplicates(encoded_variants):
-    #     logger.error(f"Duplicate argument variants found for test '{test_name}'")
-    #     return None
-
-    logger.debug(f"Final variants of the arguments = {encoded_variants}")
-    return VARIANT_SEP.join(encoded_variants)
-
-
-def decode_variants(raw_value: str) -> list[TestArguments]:
+def encode_variants(variants: list[Variant]) -> VariantTable:
     """
-    Decode CLI argument string back into list of dicts.
+    Encode list of variant dicts into a table with the argument names stored only once.
+
+    Each variant gets its id, and repeated variants are stored only once, as they
+    would have the same id.
 
     Example:
-      "action:Delete,image:123;action:Copy,image:456"
-    → [{'action': 'Delete', 'image': '123'}, {'action': 'Copy', 'image': '456'}]
+      [{'action': 'Delete', 'image': '123'}, {'action': 'Copy', 'image': '456'}]
+    → {'names': ['action', 'image'], 'values': [['Delete', '123'], ['Copy', '456']],
+       'ids': ['02402e2d', '3ddc3eba']}
     """
-    variants: list[TestArguments] = []
-    for part in raw_value.split(VARIANT_SEP):
-        if not part.strip():
-            continue
-        variant = {}
-        for arg in part.split(PAIR_SEP):
-            if not arg.strip():
-                continue
-            key, value = arg.split(KV_SEP, 1)
-            variant[unquote(key.strip())] = unquote(value.strip())
-        variants.append(variant)
-    return variants
+    names: list[str] = list(variants[0]) if variants else []
+    rows: dict[str, list[ArgumentValue]] = {}
+    for variant in variants:
+        values: list[ArgumentValue] = [variant[name] for name in names]
+        rows.setdefault(variant_id(values), values)
+    return {
+        "names": names,
+        "values": list(rows.values()),
+        "ids": list(rows),
+    }
 
 
 def has_duplicates(items: list[str]) -> bool:
@@ -0,0 +1,17 @@
+from pytest_tui_runner.utils.channel.client import connect_channel
+
+
+class ResultSender:
+    """Sends the records of the finished tests to the TUI, which marks their widgets right away."""
+
+    def __init__(self, address: str) -> None:
+        """Connect to the result channel of the TUI."""
+        self._socket = connect_channel(address)
+
+    def send(self, line: str) -> None:
+        """Send one record, already serialized as JSON."""
+        self._socket.sendall(f"{line}\n".encode())
+
+    def close(self) -> None:
+        """Disconnect from the result channel."""
+        self._socket.close()
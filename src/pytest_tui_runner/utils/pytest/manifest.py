@@ -0,0 +1,83 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from pytest_tui_runner.utils.types.config import Test, TestLabel, VariantTable
+
+# Command-line options of the plugin, with the path to the manifest and to the report.
+# The report has its own option, because parallel workers share the manifest
+MANIFEST_OPTION = "--tui-selection"
+REPORT_OPTION = "--tui-report"
+
+MANIFEST_KEY = pytest.StashKey["SelectionManifest"]()
+
+
+@dataclass
+class SelectionManifest:
+    """Tests selected in the TUI, passed to the pytest process as one compact file.
+
+    Attributes
+    ----------
+    tests : list[Test]
+        Selected test definitions, each with a 'label' and either 'markers' or 'test_name'.
+    variants : dict[TestLabel, VariantTable]
+        Argument variants of the selected tests with arguments, keyed by the test label.
+    from_cache : bool
+        Whether the collection was narrowed to node IDs from the collection cache.
+    queue : str | None
+        Address of the work queue, when the tests run in parallel workers.
+    failed_first : bool
+        Whether the tests that failed in the previous runs run first, then the new ones.
+    results : str | None
+        Address of the channel to which the result of every test is sent as it finishes.
+
+    """
+
+    tests: list[Test] = field(default_factory=list)
+    variants: dict[TestLabel, VariantTable] = field(default_factory=dict)
+    from_cache: bool = False
+    queue: str | None = None
+    failed_first: bool = False
+    results: str | None = None
+
+    def add_test(self, test: Test, variants: VariantTable | None = None) -> None:
+        """Add a selected test definition, optionally with its argument variants."""
+        entry: Test = {"label": test["label"]}
+        if "markers" in test:
+            entry["markers"] = test["markers"]
+        elif "test_name" in test:
+            entry["test_name"] = test["test_name"]
+        self.tests.append(entry)
+
+        if variants is not None:
+            self.variants[test["label"]] = variants
+
+    def write(self, path: Path) -> None:
+        """Write the manifest to the given file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "tests": self.tests,
+            "variants": self.variants,
+            "from_cache": self.from_cache,
+            "queue": self.queue,
+            "failed_first": self.failed_first,
+            "results": self.results,
+        }
+        with Path.open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def read(cls, path: Path) -> "SelectionManifest":
+        """Read the manifest from the given file."""
+        with Path.open(path, encoding="utf-8") as f:
+            data: dict = json.load(f)
+        return cls(
+            tests=data.get("tests", []),
+            variants=data.get("variants", {}),
+            from_cache=data.get("from_cache", False),
+            queue=data.get("queue"),
+            failed_first=data.get("failed_first", False),
+            results=data.get("results"),
+        )
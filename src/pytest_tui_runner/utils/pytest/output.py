@@ -0,0 +1,65 @@
+import asyncio
+import codecs
+from collections.abc import AsyncIterator
+
+# Size of the chunks read from the output of a pytest process, in bytes
+CHUNK_SIZE = 256 * 1024
+
+# Longest line passed on, longer lines (e.g. dumped payloads) are folded into lines of this length
+MAX_LINE_LENGTH = 4096
+
+
+def fold_line(line: str) -> list[str]:
+    """Fold a line into lines of at most 'MAX_LINE_LENGTH' characters."""
+    return [line[i : i + MAX_LINE_LENGTH] for i in range(0, len(line), MAX_LINE_LENGTH)]
+
+
+async def read_output_lines(stream: asyncio.StreamReader) -> AsyncIterator[list[str]]:
+    """Yield the lines of the output of a pytest process, read in large chunks.
+
+    Every chunk is decoded by an incremental UTF-8 decoder, so a character split between
+    two chunks is not replaced, and split into lines, which are yielded together.
+    A line longer than 'MAX_LINE_LENGTH' is folded as soon as that much of it is read,
+    so a huge line is neither held in memory as a whole nor written in one piece.
+
+    Parameters
+    ----------
+    stream : asyncio.StreamReader
+        The output of the process.
+
+    Yields
+    ------
+    list[str]
+        The lines completed by one chunk, without their line endings.
+
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    # The start of a line whose end has not been read yet
+    partial: str = ""
+    while True:
+        chunk: bytes = await stream.read(CHUNK_SIZE)
+        parts: list[str] = f"{partial}{decoder.decode(chunk, final=not chunk)}".split("\n")
+        partial = parts.pop()
+
+        lines: list[str] = []
+        for part in parts:
+            line: str = part.rstrip()
+            if len(line) > MAX_LINE_LENGTH:
+                lines.extend(fold_line(line))
+            else:
+                lines.append(line)
+
+        if not chunk:
+            if partial:
+                lines.extend(fold_line(partial.rstrip()) or [""])
+            if lines:
+                yield lines
+            return
+
+        if len(partial) > MAX_LINE_LENGTH:
+            folded: list[str] = fold_line(partial)
+            partial = folded.pop()
+            lines.extend(folded)
+
+        if lines:
+            yield lines
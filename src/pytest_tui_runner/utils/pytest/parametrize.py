@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import pytest
+from _pytest.python import Metafunc
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.pytest.encoding import variant_id
+from pytest_tui_runner.utils.pytest.manifest import SelectionManifest
+from pytest_tui_runner.utils.test_results import IGNORED_MARKERS
+
+if TYPE_CHECKING:
+    from pytest_tui_runner.utils.types.config import VariantTable
+
+PARAMETRIZE_KEY = pytest.StashKey["ParametrizeTable"]()
+
+
+@dataclass
+class Parametrization:
+    """Already decoded argument variants of one test definition."""
+
+    label: str
+    names: list[str]
+    values: list[tuple[str, ...]]
+    ids: list[str]
+
+
+@dataclass
+class ParametrizeTable:
+    """Lookup table from test functions to the argument variants selected by the user.
+
+    It is built once per pytest session, so the 'pytest_generate_tests' hook does
+    at most one lookup per test function instead of scanning the whole config.
+    """
+
+    by_test_name: dict[str, Parametrization] = field(default_factory=dict)
+    by_markers: dict[frozenset[str], Parametrization] = field(default_factory=dict)
+
+    @classmethod
+    def from_manifest(cls, manifest: SelectionManifest) -> "ParametrizeTable":
+        """Build the table from the variant table of the manifest written by the TUI."""
+        table = cls()
+        for test_def in manifest.tests:
+            variants: VariantTable | None = manifest.variants.get(test_def["label"])
+            if not variants or not variants.get("values"):
+                continue
+
+            parametrization = Parametrization(
+                label=test_def["label"],
+                names=variants["names"],
+                values=[tuple(values) for values in variants["values"]],
+                ids=variants.get("ids") or [variant_id(values) for values in variants["values"]],
+            )
+
+            # The first definition in the config wins, as it did when the config was scanned
+            if "markers" in test_def:
+                table.by_markers.setdefault(frozenset(test_def["markers"]), parametrization)
+            elif "test_name" in test_def:
+                table.by_test_name.setdefault(test_def["test_name"], parametrization)
+            else:
+                logger.error(f"Test '{test_def['label']}' has neither 'markers' nor 'test_name'")
+
+        return table
+
+    def lookup(self, metafunc: Metafunc) -> Parametrization | None:
+        """Find the argument variants for the test function, if any were selected."""
+        parametrization = self.by_test_name.get(metafunc.function.__name__)
+        if parametrization is not None or not self.by_markers:
+            return parametrization
+
+        markers = frozenset(
+            m.name for m in metafunc.definition.iter_markers() if m.name not in IGNORED_MARKERS
+        )
+        return self.by_markers.get(markers)
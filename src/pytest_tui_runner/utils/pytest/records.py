@@ -0,0 +1,134 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from pytest_tui_runner.utils.pytest.live_results import ResultSender
+from pytest_tui_runner.utils.pytest.selection import item_markers
+
+RECORDER_PLUGIN = "pytest-tui-runner-results"
+
+# Sections of the test reports with the output captured in one phase of the test
+OUTPUT_SECTIONS = ("Captured stdout", "Captured stderr", "Captured log")
+
+
+def output_spool_path(report_path: Path) -> Path:
+    """Get the path to the spool with the captured output of the tests of a report."""
+    return report_path.with_suffix(".output")
+
+
+def phase_outcome(report: pytest.TestReport) -> str:
+    """Get the outcome of the test as far as one phase of it can tell."""
+    if hasattr(report, "wasxfail"):
+        return "xpassed" if report.passed else "xfailed"
+    if report.when == "call":
+        return report.outcome
+    if report.failed:
+        return "error"
+    return report.outcome
+
+
+def variant_of(nodeid: str) -> str | None:
+    """Get the parametrization id of the test, if it has one."""
+    _, _, variant = nodeid.rpartition("::")[2].partition("[")
+    return variant[:-1] or None
+
+
+class ResultRecorder:
+    """Plugin writing one compact record per test, as soon as the test is complete.
+
+    The records go to an append-only NDJSON report and, if the TUI listens, to its result
+    channel. The first line of the report is the rootdir, to which the node IDs are
+    relative, and the output spool, every other line is the record of one test: node ID,
+    outcome, duration, markers, variant and the byte range of its output in the spool.
+    The outcome follows the pytest-json-report conventions: a failed setup or teardown
+    is an 'error', a skip in the setup is 'skipped'.
+
+    The output captured in the setup, call and teardown of a test is appended to the spool
+    as the phases finish. The phases of one test follow each other, so the output of a test
+    is one range of the spool, which the TUI reads by seeking to it.
+
+    Only the tests still running are held in memory, so the report of a huge run costs
+    no more than a small one.
+    """
+
+    def __init__(self, report_path: Path, sender: ResultSender | None = None) -> None:
+        """Open the report file, which replaces the report of a previous run."""
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        self._report = Path.open(report_path, "w", encoding="utf-8")
+        self._spool_path: Path = output_spool_path(report_path)
+        self._spool = Path.open(self._spool_path, "wb")
+        self._spool_offset: int = 0
+        self._sender: ResultSender | None = sender
+        self._markers: dict[str, list[str]] = {}
+        self._records: dict[str, dict] = {}
+
+    def write(self, record: dict) -> None:
+        """Write one record to the report and send it to the TUI."""
+        line: str = json.dumps(record, separators=(",", ":"))
+        self._report.write(f"{line}\n")
+        self._report.flush()
+        if self._sender is not None:
+            self._sender.send(line)
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        """Start the report with the rootdir and the path to the output spool."""
+        self.write({"root": str(session.config.rootpath), "output": str(self._spool_path)})
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: list[pytest.Item]) -> None:
+        """Remember the markers of the selected tests, which the reports do not contain."""
+        for item in items:
+            self._markers[item.nodeid] = sorted(item_markers(item))
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Add the report of one phase and write the record once the test is complete."""
+        record: dict | None = self._records.get(report.nodeid)
+        if record is None:
+            record = {
+                "nodeid": report.nodeid,
+                "outcome": "passed",
+                "duration": 0.0,
+                "markers": self._markers.pop(report.nodeid, []),
+                "variant": variant_of(report.nodeid),
+            }
+            self._records[report.nodeid] = record
+
+        record["duration"] += report.duration
+        self.spool_output(record, report)
+        outcome: str = phase_outcome(report)
+        if report.when == "call" or (outcome != "passed" and record["outcome"] == "passed"):
+            record["outcome"] = outcome
+
+        if report.when == "teardown":
+            record["duration"] = round(record["duration"], 6)
+            if "output" in record:
+                # The TUI may read the output as soon as it gets the record
+                self._spool.flush()
+            self.write(self._records.pop(report.nodeid))
+
+    def spool_output(self, record: dict, report: pytest.TestReport) -> None:
+        """Append the output captured in one phase of the test to the spool."""
+        # The sections of the earlier phases are repeated in the reports of the later ones
+        suffix: str = f" {report.when}"
+        chunks: list[str] = []
+        for name, content in report.sections:
+            if name.startswith(OUTPUT_SECTIONS) and name.endswith(suffix):
+                chunks.append(f"----- {name} -----\n")
+                chunks.append(content if content.endswith("\n") else f"{content}\n")
+        if not chunks:
+            return
+
+        data: bytes = "".join(chunks).encode(errors="replace")
+        self._spool.write(data)
+        if "output" not in record:
+            record["output"] = [self._spool_offset, 0]
+        record["output"][1] += len(data)
+        self._spool_offset += len(data)
+
+    def pytest_unconfigure(self) -> None:
+        """Close the report, the output spool and the result channel."""
+        self._report.close()
+        self._spool.close()
+        if self._sender is not None:
+            self._sender.close()
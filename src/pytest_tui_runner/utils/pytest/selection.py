@@ -0,0 +1,59 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.pytest.manifest import SelectionManifest
+from pytest_tui_runner.utils.test_results import IGNORED_MARKERS
+
+SELECTION_KEY = pytest.StashKey["Selection"]()
+
+
+@dataclass
+class Selection:
+    """Tests selected by the user, indexed for constant-time lookups.
+
+    It is built once per pytest session, so filtering the collected items is a single pass
+    over them with one set lookup per item.
+    """
+
+    marker_sets: set[frozenset[str]] = field(default_factory=set)
+    test_names: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_manifest(cls, manifest: SelectionManifest) -> "Selection":
+        """Build the selection from the manifest written by the TUI."""
+        selection = cls()
+        for test_def in manifest.tests:
+            if "markers" in test_def:
+                selection.marker_sets.add(frozenset(test_def["markers"]))
+            elif "test_name" in test_def:
+                selection.test_names.add(test_def["test_name"])
+            else:
+                logger.error(f"Test '{test_def['label']}' has neither 'markers' nor 'test_name'")
+
+        return selection
+
+    def matches(self, item: pytest.Item) -> bool:
+        """Check if the collected item belongs to the selection."""
+        if self.test_names and item.name.split("[")[0] in self.test_names:
+            return True
+
+        # Marker sets are the more expensive check, so they are only computed when needed
+        return bool(self.marker_sets) and item_markers(item) in self.marker_sets
+
+    def split(self, items: list[pytest.Item]) -> tuple[list[pytest.Item], list[pytest.Item]]:
+        """Split the collected items into selected and deselected ones."""
+        selected: list[pytest.Item] = []
+        deselected: list[pytest.Item] = []
+        for item in items:
+            if self.matches(item):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        return selected, deselected
+
+
+def item_markers(item: pytest.Item) -> frozenset[str]:
+    """Get the set of markers of the collected item that are relevant for selection."""
+    return frozenset(m.name for m in item.iter_markers() if m.name not in IGNORED_MARKERS)
@@ -0,0 +1,283 @@
+"""Warm pytest worker, which forks a child for every test run.
+
+The worker process imports pytest, its plugins, the conftest.py files and the test
+modules once, by collecting all tests in the background. Every run is then executed
+in a forked child, which starts with all of that already imported. The worker talks
+to the TUI through its standard streams:
+
+- The TUI writes one JSON line per run, with the pytest arguments and working directory.
+- The worker writes the output of the child, followed by a sentinel line with its
+  exit code. Sentinel lines also tell the TUI that the worker is ready, or that
+  a source file has changed and the worker has to be started again.
+"""
+
+import asyncio
+import json
+import os
+import select
+import sys
+from asyncio.subprocess import Process
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import pytest
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.paths import Paths
+from pytest_tui_runner.utils.pytest.output import read_output_lines
+
+SENTINEL = "\x00pytest-tui-runner:"
+READY_LINE = f"{SENTINEL}ready"
+STALE_LINE = f"{SENTINEL}stale"
+EXIT_PREFIX = f"{SENTINEL}exit "
+
+# How often the worker checks whether the imported source files have changed
+POLL_INTERVAL = 1.0
+
+# Exit code of the child when pytest could not be started at all
+INTERNAL_ERROR_EXIT_CODE = 3
+
+# The worker imports this package before pytest starts, so pytest cannot rewrite the asserts
+# of the plugin and would warn about it in every run, although the plugin has none to rewrite
+WORKER_PYTEST_ARGS = ["-W", "ignore::pytest.PytestAssertRewriteWarning"]
+
+
+def is_supported() -> bool:
+    """Check if the platform can fork the warm worker."""
+    return hasattr(os, "fork")
+
+
+# ------------------ WORKER PROCESS ------------------
+
+
+def warm_up() -> None:
+    """Import everything a test run needs, by collecting all tests without any output."""
+    with Path.open(Path(os.devnull), "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            pytest.main(["--collect-only", "-qq", *WORKER_PYTEST_ARGS])
+        finally:
+            sys.stdout = stdout
+
+    # The file handler of the logger runs a thread, which would not survive the fork.
+    # Every child sets the logger up again in 'pytest_configure'
+    logger.remove()
+
+
+def source_files(root: Path) -> dict[str, int]:
+    """Get the modification times of the imported modules of the user's project."""
+    files: dict[str, int] = {}
+    for module in list(sys.modules.values()):
+        file: str | None = getattr(module, "__file__", None)
+        if not file or "site-packages" in file:
+            continue
+
+        path = Path(file)
+        if root in path.parents and path.is_file():
+            files[file] = path.stat().st_mtime_ns
+    return files
+
+
+def has_changed(files: dict[str, int]) -> bool:
+    """Check if any of the imported source files has changed since the warm-up."""
+    try:
+        return any(Path(file).stat().st_mtime_ns != mtime for file, mtime in files.items())
+    except OSError:
+        return True
+
+
+def run_child(args: list[str], cwd: str) -> int:
+    """Run pytest with the given arguments in a forked child and wait for its exit code."""
+    # Anything left in the buffers would otherwise be written by both processes
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid: int = os.fork()
+    if pid == 0:
+        exit_code: int = INTERNAL_ERROR_EXIT_CODE
+        try:
+            # The child must not read the requests meant for the worker
+            devnull: int = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, sys.stdin.fileno())
+            os.chdir(cwd)
+            exit_code = int(pytest.main([*WORKER_PYTEST_ARGS, *args]))
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def write_line(line: str) -> None:
+    """Write a line to the TUI."""
+    sys.stdout.write(f"{line}\n")
+    sys.stdout.flush()
+
+
+def serve() -> None:
+    """Warm up, then run the requests of the TUI until it closes the input or a file changes."""
+    warm_up()
+    files: dict[str, int] = source_files(Paths.user_root())
+    write_line(READY_LINE)
+
+    while True:
+        readable, _, _ = select.select([sys.stdin], [], [], POLL_INTERVAL)
+        if has_changed(files):
+            write_line(STALE_LINE)
+            return
+        if not readable:
+            continue
+
+        line: str = sys.stdin.readline()
+        if not line:
+            return
+
+        request: dict = json.loads(line)
+        exit_code: int = run_child(request["args"], request["cwd"])
+        write_line(f"{EXIT_PREFIX}{exit_code}")
+
+
+# ------------------ TUI SIDE ------------------
+
+
+class WarmWorker:
+    """Handle of the warm worker process in the TUI.
+
+    The worker is started in the background as soon as the TUI is up, so it is usually
+    ready before the user has picked the tests. When it reports a changed source file,
+    it is started again. Runs that find it not ready fall back to a fresh process.
+    """
+
+    def __init__(self, cwd: Path) -> None:
+        """Initialize the handle, the worker itself is started by 'start'."""
+        self.cwd: Path = cwd
+        self._process: Process | None = None
+        self._task: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._closed: bool = False
+        self._exit: asyncio.Future[int | None] | None = None
+        self._on_line: Callable[[str], None] | None = None
+        self._drain: Callable[[], Awaitable[None]] | None = None
+
+    def start(self) -> None:
+        """Start the worker in the background."""
+        self._task = asyncio.create_task(self._keep_running())
+
+    async def _keep_running(self) -> None:
+        """Run the worker and start it again every time it becomes stale."""
+        while not self._closed:
+            logger.debug("▶️ Starting warm pytest worker...")
+            self._process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                __name__,
+                env={**os.environ, Paths.ROOT_ENV_VAR: str(Paths.user_root())},
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self.cwd,
+            )
+            was_ready: bool = await self._read_output(self._process)
+            await self._process.wait()
+            self._ready.clear()
+            self._finish_run(None)
+
+            # A worker that never got ready would fail the same way again
+            if not was_ready:
+                logger.warning("Warm pytest worker failed to start, tests run in new processes")
+                return
+            if not self._closed:
+                logger.info("Source files changed, restarting warm pytest worker")
+
+    async def _read_output(self, process: Process) -> bool:
+        """Dispatch the output of the worker until it exits, return whether it got ready."""
+        if process.stdout is None:
+            raise RuntimeError("Process stdout is not available.")
+
+        was_ready: bool = False
+        async for lines in read_output_lines(process.stdout):
+            for line in lines:
+                if line == READY_LINE:
+                    logger.debug("✅ Warm pytest worker ready")
+                    was_ready = True
+                    self._ready.set()
+                elif line == STALE_LINE:
+                    return was_ready
+                elif line.startswith(EXIT_PREFIX):
+                    self._finish_run(int(line.removeprefix(EXIT_PREFIX)))
+                    self._ready.set()
+                elif self._on_line is not None:
+                    self._on_line(line)
+                else:
+                    logger.debug(f"Warm pytest worker: {line}")
+            if self._drain is not None:
+                await self._drain()
+        return was_ready
+
+    def _finish_run(self, exit_code: int | None) -> None:
+        """Resolve the run in progress, if any."""
+        if self._exit is not None and not self._exit.done():
+            self._exit.set_result(exit_code)
+        self._on_line = None
+        self._drain = None
+
+    async def run(
+        self,
+        args: list[str],
+        on_line: Callable[[str], None],
+        drain: Callable[[], Awaitable[None]] | None = None,
+    ) -> int | None:
+        """Run pytest in a forked child of the worker.
+
+        Parameters
+        ----------
+        args : list[str]
+            pytest arguments, without the interpreter and '-m pytest'.
+        on_line : Callable[[str], None]
+            Called with every line of the output.
+        drain : Callable[[], Awaitable[None]] | None, optional
+            Awaited after every line, so a slow consumer of the lines slows the output down.
+
+        Returns
+        -------
+        int | None
+            Exit code of pytest, or None if the worker could not run the tests,
+            in which case they have to run in a new process.
+
+        """
+        if self._task is None or self._task.done():
+            return None
+
+        # A worker that is still warming up is usually ready sooner than a new process
+        ready = asyncio.ensure_future(self._ready.wait())
+        await asyncio.wait({ready, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if not ready.done():
+            ready.cancel()
+            return None
+
+        process: Process | None = self._process
+        if process is None or process.stdin is None:
+            return None
+
+        self._ready.clear()
+        self._exit = asyncio.get_running_loop().create_future()
+        self._on_line = on_line
+        self._drain = drain
+        request: dict = {"args": args, "cwd": str(self.cwd)}
+        process.stdin.write(json.dumps(request).encode() + b"\n")
+        await process.stdin.drain()
+        return await self._exit
+
+    def close(self) -> None:
+        """Stop the worker."""
+        self._closed = True
+        if self._process is not None and self._process.returncode is None:
+            self._process.terminate()
+        if self._task is not None:
+            self._task.cancel()
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,65 @@
+import json
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.utils.channel.client import connect_channel
+from pytest_tui_runner.utils.pytest.collection_cache import base_node_id
+
+WORK_QUEUE_KEY = pytest.StashKey["WorkQueueClient"]()
+
+
+class WorkQueueClient:
+    """Worker side of the work queue, used by the plugin in 'pytest_runtestloop'."""
+
+    def __init__(self, address: str) -> None:
+        """Connect to the work queue of the TUI."""
+        self._socket = connect_channel(address)
+        self._file = self._socket.makefile("rwb")
+
+    def next_unit(self) -> str | None:
+        """Get the next unit of work, or None if there is nothing left."""
+        self._file.write(b"next\n")
+        self._file.flush()
+        line: bytes = self._file.readline()
+        if not line:
+            return None
+        return json.loads(line)["unit"]
+
+    def close(self) -> None:
+        """Disconnect from the work queue."""
+        self._file.close()
+        self._socket.close()
+
+    def iter_items(
+        self,
+        rootdir: Path,
+        items: list[pytest.Item],
+    ) -> Iterator[tuple[pytest.Item, pytest.Item | None]]:
+        """Yield the collected items of the units pulled from the queue, with the next item.
+
+        The next unit is fetched before the last item of the current one runs, so pytest
+        knows which fixtures can stay set up for the next item.
+        """
+        items_by_unit: dict[str, list[pytest.Item]] = {}
+        for item in items:
+            items_by_unit.setdefault(str(rootdir / base_node_id(item)), []).append(item)
+
+        pending: deque[pytest.Item] = deque()
+
+        def fetch() -> None:
+            while (unit := self.next_unit()) is not None:
+                if unit in items_by_unit:
+                    pending.extend(items_by_unit[unit])
+                    return
+                logger.warning(f"Work unit '{unit}' does not match any collected test")
+
+        fetch()
+        while pending:
+            item: pytest.Item = pending.popleft()
+            if not pending:
+                fetch()
+            yield item, pending[0] if pending else None
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from pytest_tui_runner.utils.test_results import TestResult
+
+# Key of the results of all variants of a test, used for the widgets without arguments
+ALL_VARIANTS = None
+
+# Markers or test name, as a test of the config identifies its pytest tests
+TestKey = frozenset[str] | str
+# Id of one variant, "" for the results without arguments
+VariantKey = str | None
+
+
+@dataclass(slots=True)
+class ShownResult:
+    """The result shown for a group of test results.
+
+    The first result that did not pass wins, so a failed variant is not hidden by a later
+    passed one. If all passed, the last result is shown.
+
+    Attributes
+    ----------
+    result : TestResult
+        The result shown.
+    position : int
+        Position of the result in the order the results were added, to merge two groups.
+
+    """
+
+    result: TestResult
+    position: int
+
+    def add(self, result: TestResult, position: int) -> None:
+        """Add a later result to the group."""
+        if self.result.outcome == "passed":
+            self.result = result
+            self.position = position
+
+    def merge(self, other: "ShownResult | None") -> "ShownResult":
+        """Get the result shown for the union of two groups."""
+        if other is None:
+            return self
+
+        first, last = sorted((self, other), key=lambda shown: shown.position)
+        return first if first.result.outcome != "passed" else last
+
+
+@lru_cache(maxsize=1024)
+def marker_key(markers: tuple[str, ...]) -> frozenset[str]:
+    """Get the key of the results with the given markers, the same tuples repeat a lot."""
+    return frozenset(markers)
+
+
+def result_variant_id(args: str | None) -> str:
+    """Get the variant id from the parametrization id of a test result.
+
+    The variant is parametrized before the own parametrizations of the test function,
+    so its id comes first in the parametrization id, which pytest joins with dashes.
+    """
+    if not args:
+        return ""
+    return args.split("-", 1)[0]
+
+
+class ResultIndex:
+    """Results of the tests indexed by what the widgets know about them.
+
+    Every result is added once under its test name and under its set of markers, both
+    for its own variant id and for all variants together. A widget then finds the result
+    it shows with one lookup, however many results there are.
+    """
+
+    def __init__(self, test_results: list[TestResult] | None = None) -> None:
+        """Index the given results."""
+        self._shown: dict[tuple[TestKey, VariantKey], ShownResult] = {}
+        self._count: int = 0
+        if test_results:
+            self.add(test_results)
+
+    def __len__(self) -> int:
+        """Get the number of indexed results."""
+        return self._count
+
+    def add(self, test_results: list[TestResult]) -> None:
+        """Index more results, which come after those already indexed."""
+        for test_result in test_results:
+            variant: VariantKey = result_variant_id(test_result.args)
+            keys: list[TestKey] = [marker_key(test_result.markers)]
+            if test_result.test_name:
+                keys.append(test_result.test_name)
+
+            for key in keys:
+                for variant_key in (variant, ALL_VARIANTS):
+                    shown: ShownResult | None = self._shown.get((key, variant_key))
+                    if shown is None:
+                        self._shown[key, variant_key] = ShownResult(test_result, self._count)
+                    else:
+                        shown.add(test_result, self._count)
+            self._count += 1
+
+    def lookup(self, key: TestKey, variant: VariantKey = ALL_VARIANTS) -> TestResult | None:
+        """Get the result shown for a test of the config.
+
+        Parameters
+        ----------
+        key : TestKey
+            Set of markers or name of the test.
+        variant : VariantKey
+            Id of one variant, or ALL_VARIANTS for the result of all variants together.
+
+        Returns
+        -------
+        TestResult | None
+            The result to show, or None if no result matches.
+
+        """
+        shown: ShownResult | None = self._shown.get((key, variant))
+        if variant:
+            # Results without arguments belong to every variant
+            without_args: ShownResult | None = self._shown.get((key, ""))
+            shown = without_args.merge(shown) if without_args is not None else shown
+        return shown.result if shown is not None else None
@@ -0,0 +1,221 @@
+import mmap
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from pytest_tui_runner.logging import logger
+from pytest_tui_runner.paths import Paths
+from pytest_tui_runner.utils.search_index import BLOCK_LINES, SearchIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Line of the terminal with its style, None for the basic highlighting
+TerminalLine = tuple[str, str | None]
+
+
+class SpillFile:
+    """Output of one run, written to a file and read back through a memory map.
+
+    The offsets of the lines are kept in memory, so any line is read without scanning
+    the file. The map is created when the lines are first read and mapped again
+    when the file has grown since.
+    """
+
+    def __init__(self, path: Path, first_line: int) -> None:
+        """Create the file of the run.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the file, an existing file is overwritten.
+        first_line : int
+            Number of the first line of the run in the output of the session.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path: Path = path
+        self.first_line: int = first_line
+        self._file: BinaryIO = path.open("w+b")
+        # Offset of the start of every line, followed by the end of the last one
+        self._offsets: array[int] = array("Q", [0])
+        self._map: mmap.mmap | None = None
+
+    def __len__(self) -> int:
+        """Get the number of lines in the file."""
+        return len(self._offsets) - 1
+
+    def append(self, lines: list[str]) -> None:
+        """Write lines at the end of the file."""
+        chunks: list[bytes] = []
+        offset: int = self._offsets[-1]
+        for line in lines:
+            chunk: bytes = f"{line}\n".encode(errors="replace")
+            chunks.append(chunk)
+            offset += len(chunk)
+            self._offsets.append(offset)
+        self._file.write(b"".join(chunks))
+
+    def read(self, start: int, stop: int) -> list[str]:
+        """Read the lines from start to stop, numbered from the start of the run."""
+        end: int = self._offsets[stop]
+        if end == 0:
+            return []
+
+        data: mmap.mmap = self._mapped(end)
+        offsets: array[int] = self._offsets
+        return [
+            data[offsets[i] : offsets[i + 1] - 1].decode(errors="replace")
+            for i in range(start, stop)
+        ]
+
+    def read_text(self, start: int, stop: int) -> str:
+        """Read the lines from start to stop as one text, every line ended by a newline."""
+        begin, end = self._offsets[start], self._offsets[stop]
+        if begin == end:
+            return ""
+        return self._mapped(end)[begin:end].decode(errors="replace")
+
+    def _mapped(self, end: int) -> mmap.mmap:
+        """Get the map of the file, mapped again if it does not reach the end yet."""
+        if self._map is None or len(self._map) < end:
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def close(self) -> None:
+        """Close the map and the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class Scrollback:
+    """Output of all runs of the session, with every run spilled to its own file.
+
+    The lines are numbered across the runs, so the terminal can page through the whole
+    session. Only the offsets of the lines, the styles of the few styled lines and
+    the search index of the lines are kept in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scrollback, the first file is created with the first line."""
+        self._runs: list[SpillFile] = []
+        self._styles: dict[int, str] = {}
+        self.index = SearchIndex()
+
+    def __len__(self) -> int:
+        """Get the number of lines of all runs."""
+        if not self._runs:
+            return 0
+        return self._runs[-1].first_line + len(self._runs[-1])
+
+    def start_run(self) -> None:
+        """Write the next lines to the file of a new run."""
+        if not self._runs:
+            # The files of the previous sessions are not shown anymore
+            for path in Paths.terminal_dir().glob("run_*.txt"):
+                path.unlink(missing_ok=True)
+
+        path: Path = Paths.terminal_output(len(self._runs))
+        logger.debug(f"Spilling the terminal output of the run to '{path}'")
+        self._runs.append(SpillFile(path, len(self)))
+
+    def append(self, lines: list[TerminalLine]) -> None:
+        """Add lines at the end of the current run."""
+        if not self._runs:
+            self.start_run()
+
+        first_line: int = len(self)
+        for i, (_, style) in enumerate(lines):
+            if style:
+                self._styles[first_line + i] = style
+        texts: list[str] = [line for line, _ in lines]
+        self._runs[-1].append(texts)
+        self.index.add(texts)
+
+    def read(self, start: int, stop: int) -> list[TerminalLine]:
+        """Read the lines from start to stop, from the files of the runs they belong to."""
+        lines: list[TerminalLine] = []
+        for run, run_start, run_stop in self._runs_of(start, stop):
+            texts: list[str] = run.read(run_start - run.first_line, run_stop - run.first_line)
+            lines.extend(
+                (text, self._styles.get(line_no))
+                for line_no, text in enumerate(texts, start=run_start)
+            )
+        return lines
+
+    def read_text(self, start: int, stop: int) -> str:
+        """Read the lines from start to stop as one text, without their styles."""
+        return "".join(
+            run.read_text(run_start - run.first_line, run_stop - run.first_line)
+            for run, run_start, run_stop in self._runs_of(start, stop)
+        )
+
+    def _runs_of(self, start: int, stop: int) -> Iterator[tuple[SpillFile, int, int]]:
+        """Yield the runs with the lines from start to stop, with the part in each run."""
+        first_lines: list[int] = [run.first_line for run in self._runs]
+        index: int = max(bisect_right(first_lines, start) - 1, 0)
+        while start < stop and index < len(self._runs):
+            run: SpillFile = self._runs[index]
+            run_stop: int = min(stop, run.first_line + len(run))
+            yield run, start, run_stop
+            start = run_stop
+            index += 1
+
+    def search(self, query: str, start: int, *, backward: bool = False) -> int | None:
+        """Find the first line containing the query, ignoring case.
+
+        Parameters
+        ----------
+        query : str
+            The searched text.
+        start : int
+            Line from which the search starts, it is searched too.
+        backward : bool, optional
+            Search towards the first line instead of the last one.
+
+        Returns
+        -------
+        int | None
+            Number of the found line, None if no line from the start contains the query.
+
+        """
+        query = query.lower()
+        blocks: Sequence[int] | None = self.index.candidate_blocks(query)
+        if blocks is None:
+            blocks = range((len(self) + BLOCK_LINES - 1) // BLOCK_LINES)
+
+        # Only the candidate blocks are read, from the block of the start line on
+        start_block: int = start // BLOCK_LINES
+        if backward:
+            searched: Sequence[int] = blocks[: bisect_right(blocks, start_block)][::-1]
+        else:
+            searched = blocks[bisect_left(blocks, start_block) :]
+
+        for block in searched:
+            first: int = block * BLOCK_LINES
+            stop: int = min(first + BLOCK_LINES, len(self))
+            if backward:
+                stop = min(stop, start + 1)
+            else:
+                first = max(first, start)
+            # The whole block is checked at once, its lines only if it contains the query
+            if query not in self.read_text(first, stop).lower():
+                continue
+
+            lines: list[tuple[int, TerminalLine]] = list(enumerate(self.read(first, stop), first))
+            for line_no, (text, _) in reversed(lines) if backward else lines:
+                if query in text.lower():
+                    return line_no
+        return None
+
+    def close(self) -> None:
+        """Close the files of all runs."""
+        for run in self._runs:
+            run.close()
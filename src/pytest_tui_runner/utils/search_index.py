@@ -0,0 +1,135 @@
+import re
+from array import array
+
+# Number of consecutive lines indexed together, a search reads only the blocks it may match
+BLOCK_LINES = 64
+
+# Longest part of a token that is indexed, longer tokens (e.g. dumped data) are cut
+MAX_TOKEN_LENGTH = 64
+
+# Parts of the query at its edges shorter than this match too many tokens to narrow the search
+MIN_EDGE_LENGTH = 3
+
+# Tokens are the runs of word characters, indexed in lowercase
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class SearchIndex:
+    """Index of the tokens of the terminal output, built while the output is written.
+
+    The lines are indexed in blocks of 'BLOCK_LINES' lines: every token maps to the blocks
+    it occurs in. A search looks up the tokens of the query and only the blocks containing
+    all of them have to be read, so it takes milliseconds however long the output is.
+
+    The tokens inside the query are whole tokens of the matched line, which are looked up
+    directly. The tokens at its edges may be parts of longer ones, e.g. 'Assert' of
+    'AssertionError', so they are searched for in the vocabulary, which is one string
+    of all tokens to be searched in C.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.lines: int = 0
+        self._ids: dict[str, int] = {}
+        # Blocks in which the token with the id occurs, in increasing order
+        self._blocks: list[array[int]] = []
+        # Blocks with a token longer than 'MAX_TOKEN_LENGTH', whose end is not indexed
+        self._long_token_blocks: array[int] = array("I")
+        # Tokens separated by newlines and the tokens not added to it yet,
+        # it is only updated when searched
+        self._vocabulary: str = "\n"
+        self._new_tokens: list[str] = []
+
+    def add(self, lines: list[str]) -> None:
+        """Index lines following the already indexed lines."""
+        ids: dict[str, int] = self._ids
+        blocks: list[array[int]] = self._blocks
+        position: int = 0
+        while position < len(lines):
+            block: int = self.lines // BLOCK_LINES
+            count: int = min((block + 1) * BLOCK_LINES - self.lines, len(lines) - position)
+            text: str = "\n".join(lines[position : position + count]).lower()
+            for found in set(TOKEN_PATTERN.findall(text)):
+                token: str = found
+                if len(found) > MAX_TOKEN_LENGTH:
+                    token = found[:MAX_TOKEN_LENGTH]
+                    if not self._long_token_blocks or self._long_token_blocks[-1] != block:
+                        self._long_token_blocks.append(block)
+                token_id: int | None = ids.get(token)
+                if token_id is None:
+                    ids[token] = len(blocks)
+                    blocks.append(array("I", [block]))
+                    self._new_tokens.append(token)
+                elif blocks[token_id][-1] != block:
+                    blocks[token_id].append(block)
+            position += count
+            self.lines += count
+
+    def candidate_blocks(self, query: str) -> list[int] | None:
+        """Get the blocks that may contain the query, in increasing order.
+
+        Parameters
+        ----------
+        query : str
+            The searched text, in lowercase.
+
+        Returns
+        -------
+        list[int] | None
+            The blocks containing all tokens of the query, None if the query has no token
+            that narrows the search, so every block has to be read.
+
+        """
+        candidates: set[int] | None = None
+        for match in TOKEN_PATTERN.finditer(query):
+            part: str = match.group()
+            at_start: bool = match.start() == 0
+            at_end: bool = match.end() == len(query)
+            if not (at_start or at_end):
+                blocks: set[int] = self._blocks_of_token(part[:MAX_TOKEN_LENGTH])
+            elif len(part) < MIN_EDGE_LENGTH or len(part) > MAX_TOKEN_LENGTH:
+                continue
+            else:
+                # A part at the start of the query ends a token, at its end starts one
+                needle: str = part
+                if not at_start:
+                    needle = f"\n{needle}"
+                if not at_end:
+                    needle = f"{needle}\n"
+                blocks = self._blocks_of_tokens_with(needle)
+                if at_start:
+                    # The part may be in the end of a long token, which is not indexed
+                    blocks.update(self._long_token_blocks)
+
+            candidates = blocks if candidates is None else candidates & blocks
+            if not candidates:
+                return []
+
+        return None if candidates is None else sorted(candidates)
+
+    def _blocks_of_token(self, token: str) -> set[int]:
+        """Get the blocks containing a whole token."""
+        token_id: int | None = self._ids.get(token)
+        return set() if token_id is None else set(self._blocks[token_id])
+
+    def _blocks_of_tokens_with(self, needle: str) -> set[int]:
+        """Get the blocks containing any token of the vocabulary that contains the needle."""
+        self._update_vocabulary()
+        vocabulary: str = self._vocabulary
+        # A needle starting with the separator is found before the token it starts
+        shift: int = 1 if needle.startswith("\n") else 0
+
+        blocks: set[int] = set()
+        position: int = vocabulary.find(needle)
+        while position != -1:
+            start: int = vocabulary.rfind("\n", 0, position + shift) + 1
+            end: int = vocabulary.find("\n", position + shift)
+            blocks.update(self._blocks[self._ids[vocabulary[start:end]]])
+            position = vocabulary.find(needle, end)
+        return blocks
+
+    def _update_vocabulary(self) -> None:
+        """Add the new tokens to the vocabulary."""
+        if self._new_tokens:
+            self._vocabulary += "\n".join(self._new_tokens) + "\n"
+            self._new_tokens.clear()
@@ -1,74 +1,150 @@
+import json
+import shutil
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
 from pytest_tui_runner.logging import logger
 
 IGNORED_MARKERS = {"skip", "xfail"}
 
 
-@dataclass
-class TestResult:
-    """Represents the result of a test with its markers and outcome."""
+@dataclass(frozen=True, slots=True)
+class TestOutput:
+    """Byte range of the output of one test in the output spool of its pytest process.
 
-    markers: list[str]
-    outcome: str
-    args: dict[str, str] | None = None
-    test_name: str | None = None
+    Attributes
+    ----------
+    spool : str
+        Path to the output spool, shared by all results of the process.
+    offset : int
+        Offset of the output in the spool.
+    length : int
+        Length of the output in bytes.
 
+    """
 
-def extract_tests_results(report: dict) -> list[TestResult]:
-    """Extract test results and their markers from a pytest JSON report."""
-    tests_results: list[TestResult] = []
+    spool: str
+    offset: int
+    length: int
 
-    tests = report.get("tests", [])
-    for test in tests:
-        logger.debug(f"▶️ PROCESSING test result = {test} ...")
-        test_result = test.get("outcome", "")
-        keywords = test.get("keywords", [])
+    def read(self) -> str:
+        """Read the output from the spool."""
+        with Path.open(Path(self.spool), "rb") as f:
+            f.seek(self.offset)
+            return f.read(self.length).decode(errors="replace")
 
-        if not keywords:
-            logger.error("Test has no keywords.")
-            continue
-        test_name = keywords[0]
 
-        logger.debug(f"Keywords: {keywords}")
-        logger.debug(f"Test name: '{test_name}'")
-        logger.debug(f"Test result: '{test_result}'")
+@dataclass(slots=True)
+class TestResult:
+    """Represents the result of a test with its markers and outcome.
+
+    Reports can have hundreds of thousands of results, so they use slots, and the markers,
+    outcomes and test names that repeat across the results are shared between them.
+    """
 
-        # Extract test marks
-        marks = []
-        for kw in keywords[1:]:
-            if kw == "pytestmark":
-                break
-            if kw in IGNORED_MARKERS:
+    markers: tuple[str, ...]
+    outcome: str
+    args: str | None = None
+    test_name: str | None = None
+    nodeid: str | None = None
+    duration: float = 0.0
+    output: TestOutput | None = None
+
+
+@lru_cache(maxsize=1024)
+def intern_markers(markers: tuple[str, ...]) -> tuple[str, ...]:
+    """Get one shared tuple for every distinct set of markers."""
+    return markers
+
+
+def result_from_record(record: dict, spool: str | None = None) -> TestResult:
+    """Build a test result from a compact record written by the plugin.
+
+    Parameters
+    ----------
+    record : dict
+        The record of one test.
+    spool : str | None, optional
+        Path to the output spool of the pytest process that wrote the record.
+
+    Returns
+    -------
+    TestResult
+        The result of the test.
+
+    """
+    nodeid: str = record["nodeid"]
+    test_name: str = nodeid.rsplit("::", 1)[-1].split("[", 1)[0]
+    output: TestOutput | None = None
+    if spool is not None and "output" in record:
+        output = TestOutput(spool, *record["output"])
+    return TestResult(
+        markers=intern_markers(tuple(record.get("markers", ()))),
+        outcome=sys.intern(record["outcome"]),
+        args=record.get("variant"),
+        test_name=sys.intern(test_name),
+        nodeid=nodeid,
+        duration=record.get("duration", 0.0),
+        output=output,
+    )
+
+
+class ReportReader:
+    """Streaming reader of the NDJSON report written by the plugin.
+
+    Iterating over it yields the results one by one, so the report is never held
+    in memory as a whole. The rootdir, to which the node IDs are relative, is known
+    once the iteration has started. A report merged from the reports of parallel workers
+    has the header of each worker before its records, with the output spool of the worker.
+
+    Usage::
+
+        reader = ReportReader(Paths.pytest_report())
+        for test_result in reader:
+            ...
+        reader.rootdir
+    """
+
+    def __init__(self, report_path: Path) -> None:
+        """Initialize the reader, the report is only opened by the iteration."""
+        self.report_path: Path = report_path
+        self.rootdir: str = ""
+
+    def __iter__(self) -> Iterator[TestResult]:
+        """Yield the results of the tests in the order they finished."""
+        logger.debug(f"Loading report from path: {self.report_path}")
+        if not self.report_path.exists():
+            logger.error(f"Report file not found: {self.report_path}")
+            raise FileNotFoundError(f"Report file not found: {self.report_path}")
+
+        count: int = 0
+        spool: str | None = None
+        with Path.open(self.report_path, encoding="utf-8") as f:
+            for line in f:
+                record: dict = json.loads(line)
+                if "root" in record:
+                    self.rootdir = record["root"]
+                    spool = record.get("output")
+                    continue
+
+                count += 1
+                yield result_from_record(record, spool)
+
+        logger.debug(f"{count} test results read from the report")
+
+
+def merge_reports(report_paths: list[Path], target: Path) -> None:
+    """Merge the NDJSON reports of the parallel workers into a single report."""
+    with Path.open(target, "wb") as merged:
+        for report_path in report_paths:
+            if not report_path.exists():
+                logger.warning(f"Report of a worker not found: {report_path}")
                 continue
-            marks.append(kw)
-
-        logger.debug(f"Extracted marks: {marks}")
-
-        # Check if test (first keyword) is test with arguments (has format test_name[args])
-        if "[" in test_name and test_name.endswith("]"):
-            name_without_args, test_args = test_name.split("[", 1)
-            test_args = test_args[:-1]  # Remove the closing ']'
-
-            logger.debug(f"Test WITH arguments saved: '{name_without_args}'")
-            tests_results.append(
-                TestResult(
-                    test_name=name_without_args,
-                    markers=marks,
-                    outcome=test_result,
-                    args=test_args,
-                ),
-            )
-        else:
-            logger.debug(f"Test WITHOUT arguments saved: '{test_name}'")
-            tests_results.append(
-                TestResult(test_name=test_name, markers=marks, outcome=test_result),
-            )
-        logger.debug("✅ Test result processed")
-
-    if not tests_results:
-        logger.debug("WARNING: No test results found in the report.")
-
-    logger.debug(f"ALL Test results extracted: {tests_results}")
-
-    return tests_results
+
+            with Path.open(report_path, "rb") as report:
+                shutil.copyfileobj(report, merged)
+
+    logger.debug(f"Merged the reports of {len(report_paths)} workers")
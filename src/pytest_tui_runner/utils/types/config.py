@@ -1,6 +1,7 @@
 from typing import Literal
 
 ArgumentName = str
+ArgumentValue = str
 ArgumentType = Literal["select", "text_input"]
 AdditionalInfo = list[str] | str | None
 
@@ -9,6 +10,11 @@ Argument = dict[
     ArgumentName | ArgumentType | AdditionalInfo,
 ]
 
+# One set of values for the arguments of a test, as entered by the user
+Variant = dict[ArgumentName, ArgumentValue]
+# All variants of a test, as {"names": [...], "values": [[...], ...], "ids": [...]}
+VariantTable = dict[str, list[ArgumentName] | list[list[ArgumentValue]]]
+
 TestLabel = str
 TestName = str
 Markers = list[str]
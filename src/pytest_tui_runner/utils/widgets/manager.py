@@ -8,6 +8,7 @@ from pathlib import Path
 from pytest_tui_runner.logging import logger
 from pytest_tui_runner.utils.types.config import TestConfig
 from pytest_tui_runner.utils.widgets.composer import compose_widgets
+from pytest_tui_runner.utils.widgets.registry import WidgetRegistry
 from pytest_tui_runner.utils.widgets.state_manager import load_widget_state, save_widget_state
 from pytest_tui_runner.utils.widgets.widget_generator import generate_widgets_from_config
 
@@ -23,6 +24,8 @@ class WidgetManager:
         The path to the widget state file.
     widgets : dict
         Dictionary holding the generated widgets.
+    registry : WidgetRegistry
+        Registry from the generated widgets to their test definitions.
 
     Methods
     -------
@@ -51,6 +54,7 @@ class WidgetManager:
         self.config: TestConfig = config
         self.state_path: Path = state_path
         self.widgets: WidgetsDict = {}
+        self.registry = WidgetRegistry()
 
         logger.debug("Initializing WidgetManager...")
         self.generate()
@@ -65,7 +69,12 @@ class WidgetManager:
         """
         logger.debug("▶️ Starting to generate widgets...")
         try:
-            self.widgets = generate_widgets_from_config(self.config, self.state_path)
+            self.registry = WidgetRegistry()
+            self.widgets = generate_widgets_from_config(
+                self.config,
+                self.state_path,
+                self.registry,
+            )
             if not self.widgets:
                 logger.warning("No widgets generated from the configuration.")
         except Exception as e:
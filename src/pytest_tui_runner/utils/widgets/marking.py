@@ -1,57 +1,76 @@
-import json
-from pathlib import Path
-
 from textual.widget import Widget
 from textual.widgets import Select
 
-from pytest_tui_runner.logging import logger
-from pytest_tui_runner.utils.config import get_test_result
-from pytest_tui_runner.utils.test_results import TestResult, extract_tests_results
-from pytest_tui_runner.utils.types.widgets import WidgetsDict
+from pytest_tui_runner.logging import debug_lazy, logger
+from pytest_tui_runner.utils.pytest.encoding import variant_id
+from pytest_tui_runner.utils.result_index import ResultIndex, TestKey
+from pytest_tui_runner.utils.test_results import TestResult
+from pytest_tui_runner.utils.types.widgets import TestArguments
+from pytest_tui_runner.utils.widgets.registry import RegisteredTest, WidgetRegistry
+
+# Classes of the widgets that show the outcome of their tests
+RESULT_STYLES = ["passed", "failed", "skipped", "xfailed", "error"]
 
 
-def reset_widgets_style(widgets: WidgetsDict) -> None:
+def reset_widgets_style(registry: WidgetRegistry) -> None:
     """Remove marks from widgets."""
-    for category in widgets.values():
-        for subcategory in category.values():
-            for widget_list in subcategory.values():
-                if (
-                    isinstance(widget_list, list)
-                    and widget_list
-                    and isinstance(widget_list[0], list)
-                ):
-                    for inner_list in widget_list:
-                        reset_widget_list(inner_list)
-                else:
-                    reset_widget_list(widget_list)
-
-
-def mark_widgets_from_report(widgets: WidgetsDict, report_path: Path) -> None:
-    """Update widget styles based on pytest JSON report outcomes."""
-    logger.debug(f"Loading report to mark widgets from path: {report_path}")
-    if not report_path.exists():
-        logger.error(f"Report file not found: {report_path}")
-        raise FileNotFoundError(f"Report file not found: {report_path}")
-
-    with Path.open(report_path, encoding="utf-8") as f:
-        report: dict = json.load(f)
-
-    logger.debug("▶️ Extracting test results from report...")
-    test_results: list[TestResult] = extract_tests_results(report)
-    logger.debug("✅ Test results extracted")
-
-    for category in widgets.values():
-        for subcategory in category.values():
-            for widget_list in subcategory.values():
-                for test in widget_list:
-                    logger.debug(f"▶️ Getting result for test {test}...")
-                    test_result = get_test_result(test, test_results)
-                    logger.debug(f"✅ Result = {test_result}")
-
-                    if not test_result:
-                        logger.debug("Widget does not have test result")
-                    else:
-                        process_widgets(test, test_result)
+    for registered in registry:
+        if registered.has_arguments:
+            for row in registered.widgets:
+                reset_widget_list(row)
+        else:
+            reset_widget_list(registered.widgets)
+
+
+def mark_widgets_from_results(registry: WidgetRegistry, index: ResultIndex) -> None:
+    """Update widget styles based on the outcomes of the indexed test results."""
+    for registered in registry:
+        mark_registered_test(registered, index)
+
+
+def mark_widgets_from_new_results(
+    registry: WidgetRegistry,
+    new_results: list[TestResult],
+    index: ResultIndex,
+) -> None:
+    """Update the styles of the widgets with new results, while the tests are still running.
+
+    Only the widgets of the tests with new results are updated, from all results received
+    so far, so a failed variant of a test is not hidden by its later passed variant.
+    """
+    for registered in registry.tests_of_results(new_results):
+        mark_registered_test(registered, index, replace=True)
+
+
+def mark_registered_test(
+    registered: RegisteredTest,
+    index: ResultIndex,
+    *,
+    replace: bool = False,
+) -> None:
+    """Mark the widgets of one test with their results, if replace, the previous ones go."""
+    if registered.key is None:
+        return
+
+    for test in registered.widgets:
+        test_result: TestResult | None = get_test_result(test, registered.key, index)
+        if test_result is None:
+            continue
+
+        if replace:
+            clear_result_styles(test)
+        process_widgets(test, test_result)
+
+
+def get_test_result(
+    test: Widget | TestArguments,
+    key: TestKey,
+    index: ResultIndex,
+) -> TestResult | None:
+    """Get the test result corresponding to the given widget or row of argument widgets."""
+    if isinstance(test, list):
+        return index.lookup(key, variant_id([str(widget.value) for widget in test]))
+    return index.lookup(key)
 
 
 def process_widgets(widgets: Widget | list[Widget], test_result: TestResult) -> None:
@@ -81,20 +100,6 @@ def process_widget(widget: Widget, test_result: TestResult) -> None:
         reset_widget(widget)
 
 
-def parse_result_arg_values(args: str) -> list[str]:
-    """Parse argument values from test result args string."""
-    if not args:
-        logger.error("No args to parse.")
-        return []
-
-    return [arg.strip() for arg in args.split("-")]
-
-
-def args_match_widget_values(args: list[str], widgets: list[Widget]) -> bool:
-    """Check if argument values match the values of the given widgets."""
-    return all(i < len(args) and args[i] == widget.value for i, widget in enumerate(widgets))
-
-
 def mark_widget_running(widget: Widget) -> None:
     """Mark widget as running."""
     add_class(widget, "running")
@@ -108,14 +113,20 @@ def mark_widget_list_running(widget_list: list[Widget]) -> None:
 
 def reset_widget_list(widgets: list[Widget]) -> None:
     """Remove all marks from widgets."""
-    logger.debug(f"Resetting widget styles {widgets}")
+    debug_lazy("Resetting widget styles {}", lambda: widgets)
     for widget in widgets:
         reset_widget(widget)
 
 
 def reset_widget(widget: Widget) -> None:
     """Remove all marks from widget."""
-    remove_classes(widget, ["running", "passed", "failed", "skipped", "xfailed", "error"])
+    remove_classes(widget, ["running", *RESULT_STYLES])
+
+
+def clear_result_styles(widgets: Widget | list[Widget]) -> None:
+    """Remove the marks of a previous result from the widgets, keeping them marked as running."""
+    for widget in widgets if isinstance(widgets, list) else [widgets]:
+        remove_classes(widget, RESULT_STYLES)
 
 
 def add_class(widget: Widget, style: str) -> None:
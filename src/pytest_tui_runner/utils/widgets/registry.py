@@ -0,0 +1,86 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from pytest_tui_runner.utils.config import ConfigIndex
+from pytest_tui_runner.utils.result_index import TestKey, marker_key
+from pytest_tui_runner.utils.test_results import TestResult
+from pytest_tui_runner.utils.types.config import Test, TestLabel
+from pytest_tui_runner.utils.types.widgets import TestArguments, TestWidgets
+
+if TYPE_CHECKING:
+    from textual.widget import Widget
+
+
+@dataclass
+class RegisteredTest:
+    """Test definition of the config together with the widgets created for it.
+
+    Attributes
+    ----------
+    test_def : Test
+        The test definition from the config.
+    key : TestKey | None
+        Markers or test name identifying the pytest tests, None if the config has neither.
+    widgets : TestWidgets
+        The checkbox of a basic test, or the rows of argument widgets of a test with
+        arguments. It is the list from the widgets dict, which SpecialTestGroup updates
+        in place when rows are added or removed.
+
+    """
+
+    test_def: Test
+    key: TestKey | None
+    widgets: TestWidgets
+
+    @property
+    def label(self) -> TestLabel:
+        """Get the label of the test."""
+        return self.test_def["label"]
+
+    @property
+    def has_arguments(self) -> bool:
+        """Check if the widgets are rows of argument widgets."""
+        return bool(self.widgets) and isinstance(self.widgets[0], list)
+
+
+@dataclass
+class WidgetRegistry:
+    """Registry from the widgets to the test definitions they were created for.
+
+    It is filled when the widgets are generated from the config, so marking the results
+    and building the selection never have to find the test of a widget in the DOM
+    or in the config. The tests showing a result are looked up in the index of the config.
+    """
+
+    tests: dict[TestLabel, RegisteredTest] = field(default_factory=dict)
+    index: ConfigIndex = field(default_factory=ConfigIndex)
+
+    def register(self, test_def: Test, widgets: TestWidgets) -> None:
+        """Register the widgets created for a test definition."""
+        # The widgets dict keeps the widgets of the last test with a repeated label
+        self.index.add(test_def)
+        label: TestLabel = test_def["label"]
+        self.tests[label] = RegisteredTest(test_def, self.index.key(label), widgets)
+
+    def __iter__(self) -> Iterator[RegisteredTest]:
+        """Yield the registered tests in the order of the config."""
+        return iter(self.tests.values())
+
+    def find(self, widget: "Widget") -> tuple[RegisteredTest, "Widget | TestArguments"] | None:
+        """Find the test of a widget, with the row of argument widgets it belongs to."""
+        for registered in self:
+            for test in registered.widgets:
+                if test is widget or (isinstance(test, list) and widget in test):
+                    return registered, test
+        return None
+
+    def tests_of_results(self, test_results: list[TestResult]) -> list[RegisteredTest]:
+        """Get the registered tests whose widgets show any of the given results."""
+        keys: dict[TestKey, None] = {}
+        for test_result in test_results:
+            keys[marker_key(test_result.markers)] = None
+            if test_result.test_name:
+                keys[test_result.test_name] = None
+
+        return [self.tests[label] for key in keys for label in self.index.labels(key)]
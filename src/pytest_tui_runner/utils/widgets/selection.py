@@ -0,0 +1,75 @@
+from textual.widgets import Checkbox, Select
+
+from pytest_tui_runner.logging import debug_enabled, debug_lazy, logger
+from pytest_tui_runner.utils.pytest.encoding import encode_variants
+from pytest_tui_runner.utils.pytest.manifest import SelectionManifest
+from pytest_tui_runner.utils.types.config import Variant
+from pytest_tui_runner.utils.types.widgets import TestArguments
+from pytest_tui_runner.utils.widgets.marking import mark_widget_list_running, mark_widget_running
+from pytest_tui_runner.utils.widgets.registry import WidgetRegistry
+
+
+def extract_widget_selection(registry: WidgetRegistry) -> SelectionManifest:
+    """Collect the tests selected in the widgets into a selection manifest."""
+    manifest = SelectionManifest()
+    for registered in registry:
+        test_name: str = registered.label
+
+        # Check if widget_list contains arguments for the test
+        if registered.has_arguments:
+            logger.debug("▶️ Encoding special test...")
+            variants: list[Variant] = read_variants(test_name, registered.widgets)
+            if variants:
+                manifest.add_test(registered.test_def, encode_variants(variants))
+                logger.debug(f"✅ Special test '{test_name}' selected")
+            else:
+                logger.debug(f"Test '{test_name}' has no set arguments")
+        else:
+            for widget in registered.widgets:
+                if isinstance(widget, Checkbox) and widget.value:
+                    manifest.add_test(registered.test_def)
+                    logger.debug(f"Basic test '{test_name}' selected")
+
+                    if debug_enabled():
+                        logger.debug(f"Marking widget as running: {widget}")
+                    mark_widget_running(widget)
+                else:
+                    logger.debug(f"Test '{test_name}' not selected")
+    return manifest
+
+
+def read_variants(test_name: str, variants: list[TestArguments]) -> list[Variant]:
+    """Read the complete variants of the arguments from the widget rows of a test.
+
+    Rows with a missing value are skipped, the others are marked as running.
+    """
+    result: list[Variant] = []
+
+    for i, widget_list in enumerate(variants):
+        logger.debug(f"Processing '{i}' variant of the arguments")
+        variant: Variant = {}
+        for widget in widget_list:
+            if hasattr(widget, "name") and hasattr(widget, "value"):
+                if widget.value in (None, "", Select.BLANK):
+                    if debug_enabled():
+                        logger.debug(f"Missing value for widget = {widget}")
+                    continue
+                variant[str(widget.name)] = str(widget.value)
+
+        if debug_enabled():
+            logger.debug(f"Processed variant of the arguments = {variant}")
+        if variant and len(variant) == len(widget_list):
+            result.append(variant)
+            logger.debug("Marking this variant as running")
+            mark_widget_list_running(widget_list)
+        else:
+            logger.debug("WARNING: This variant will be skipped because some argument is missing")
+
+    if not result:
+        logger.debug(f"Test '{test_name}' has no arguments set, so it will be skipped")
+
+    # Duplicate variants run only once, as 'encode_variants' stores every variant id once.
+    # All rows of a duplicate variant then show its one result
+
+    debug_lazy("Final variants of the arguments = {}", lambda: result)
+    return result
@@ -1,9 +1,10 @@
 import json
 from pathlib import Path
 
+from textual.widget import Widget
 from textual.widgets import Checkbox, Select
 
-from pytest_tui_runner.logging import logger
+from pytest_tui_runner.logging import debug_enabled, debug_lazy, logger
 from pytest_tui_runner.utils.types.saved_state import SavedState, TestState, TestValue
 from pytest_tui_runner.utils.types.widgets import TestWidgets, WidgetsDict
 
@@ -17,10 +18,11 @@ def load_widget_state(widgets: WidgetsDict, filename: Path) -> None:
         for subcat, tests in subcats.items():
             for test_name, test_widgets in tests.items():
                 saved_value: TestValue = _get_saved_value(saved, cat, subcat, test_name)
-                logger.debug(f"Saved value for test '{test_name}' = {saved_value}")
+                if debug_enabled():
+                    logger.debug(f"Saved value for test '{test_name}' = {saved_value}")
                 _set_widgets_values(test_widgets, saved_value)
 
-    logger.debug(f"Loaded widgets = {widgets}")
+    debug_lazy("Loaded widgets = {}", lambda: widgets)
 
 
 def save_widget_state(widgets: WidgetsDict, filename: Path) -> None:
@@ -34,10 +36,11 @@ def save_widget_state(widgets: WidgetsDict, filename: Path) -> None:
             saved[cat][subcat] = {}
             for test_name, test_widgets in tests.items():
                 value_to_save: TestValue = _serialize_test_widgets(test_widgets)
-                logger.debug(f"Value to save for test '{test_name}' = {value_to_save}")
+                if debug_enabled():
+                    logger.debug(f"Value to save for test '{test_name}' = {value_to_save}")
                 saved[cat][subcat][test_name] = value_to_save
 
-    logger.debug(f"Saved widgets = {saved}")
+    debug_lazy("Saved widgets = {}", lambda: saved)
     write_json_state_file(filename, saved)
 
 
@@ -95,20 +98,26 @@ def _set_widgets_values(test_widgets: TestWidgets, saved_values: TestValue) -> N
             logger.warning(f"Invalid saved entry format at index {i} (expected dict).")
             continue
 
-        try:
-            for widget in arguments_widgets:
-                value = saved_entry.get(widget.name)
-                if value:
+        _set_arguments_values(arguments_widgets, saved_entry)
+
+
+def _set_arguments_values(arguments_widgets: list[Widget], saved_entry: TestState) -> None:
+    """Set the saved values to one row of argument widgets."""
+    try:
+        for widget in arguments_widgets:
+            value = saved_entry.get(widget.name)
+            if value:
+                if debug_enabled():
                     logger.debug(f"Setting value for widget {widget} = '{value}'")
-                    widget.value = value
-                else:
-                    logger.debug(f"WARNING: No value saved for this widget = {widget}")
-
-        except (TypeError, AttributeError) as e:
-            logger.error(
-                f"Error setting widget '{getattr(widget, 'name', '?')}': {e}",
-                exc_info=True,
-            )
+                widget.value = value
+            elif debug_enabled():
+                logger.debug(f"WARNING: No value saved for this widget = {widget}")
+
+    except (TypeError, AttributeError) as e:
+        logger.error(
+            f"Error setting widget '{getattr(widget, 'name', '?')}': {e}",
+            exc_info=True,
+        )
 
 
 def _set_checkbox_value(test_widgets: TestWidgets, saved_values: TestValue) -> None:
@@ -3,20 +3,26 @@ from pathlib import Path
 from textual.widget import Widget
 from textual.widgets import Checkbox, Input, Select
 
-from pytest_tui_runner.logging import logger
+from pytest_tui_runner.logging import debug_lazy, logger
 from pytest_tui_runner.utils.types.config import Argument, ArgumentType, Test, TestConfig
 from pytest_tui_runner.utils.types.saved_state import SavedState, SavedSubcat, TestValue
 from pytest_tui_runner.utils.types.widgets import WidgetsDict
+from pytest_tui_runner.utils.widgets.registry import WidgetRegistry
 from pytest_tui_runner.utils.widgets.state_manager import read_json_state_file
 
 
-def generate_widgets_from_config(config: TestConfig, state_path: Path | None = None) -> WidgetsDict:
+def generate_widgets_from_config(
+    config: TestConfig,
+    state_path: Path | None = None,
+    registry: WidgetRegistry | None = None,
+) -> WidgetsDict:
     """
     Generate a nested dictionary of widgets from the given test configuration.
 
     Args:
         config: Test configuration loaded from YAML/JSON.
         state_path: Optional path to saved widget state.
+        registry: Optional registry, into which the widgets of every test are registered.
 
     Returns
     -------
@@ -42,12 +48,15 @@ def generate_widgets_from_config(config: TestConfig, state_path: Path | None = N
             widgets[cat_name][subcat_name] = {}
 
             for test in subcat.get("tests", []):
-                widgets[cat_name][subcat_name][test["label"]] = _create_test_widgets(
+                test_widgets: list[Widget] = _create_test_widgets(
                     test,
                     saved_state.get(cat_name, {}).get(subcat_name, {}),
                 )
+                widgets[cat_name][subcat_name][test["label"]] = test_widgets
+                if registry is not None:
+                    registry.register(test, test_widgets)
 
-    logger.debug(f"Generated widgets: {widgets}")
+    debug_lazy("Generated widgets: {}", lambda: widgets)
     return widgets
 
 
@@ -78,7 +87,7 @@ def _create_widgets_from_arguments(arguments: list[Argument]) -> list[Widget]:
         widget: Widget | None = _widget_from_argument(arg)
         if widget is not None:
             result.append(widget)
-    logger.debug(f"Adding one instance of arguments widgets: {result}")
+    debug_lazy("Adding one instance of arguments widgets: {}", lambda: result)
     return result
 
 
@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Source directory of the package, so the test also runs without installing it
+SRC_PATH = Path(__file__).parents[1] / "src"
+
+# Packages that only the TUI needs, pytest must not import them when it loads the plugin
+UI_PACKAGES = ("textual", "pydantic")
+
+IMPORT_CHECK = f"""
+import json, sys, importlib
+importlib.import_module(sys.argv[1])
+print(json.dumps([name for name in {UI_PACKAGES!r} if name in sys.modules]))
+"""
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["pytest_tui_runner", "pytest_tui_runner.hooks", "pytest_tui_runner.cli"],
+)
+def test_plugin_does_not_import_ui_packages(module: str) -> None:
+    """Importing the pytest plugin keeps Textual and pydantic out of every pytest run."""
+    python_path: str = os.pathsep.join(filter(None, [str(SRC_PATH), os.environ.get("PYTHONPATH")]))
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", IMPORT_CHECK, module],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": python_path},
+    )
+
+    assert json.loads(result.stdout) == []